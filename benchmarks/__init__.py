@@ -0,0 +1,4 @@
+"""
+Performance benchmarks of do_py's hot paths. See `benchmarks.run` to run them and diff results against a baseline.
+:date_created: 2026-10-17
+"""
@@ -0,0 +1,210 @@
+"""
+Benchmark cases. Each case is registered under `<group>.<name>`; calling it does the setup and returns the callable
+that is timed.
+:date_created: 2026-10-17
+"""
+
+import json
+from bisect import bisect_right
+
+from do_py import DataObject, R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.common.managed_list import OrderedManagedList, PrimitiveManagedList
+from do_py.utils.json_encoder import MyJSONEncoder
+
+from .models import (
+    ADDRESS,
+    BREAKFAST,
+    CITY,
+    FLAT,
+    NESTED,
+    ORDER,
+    Address,
+    Breakfast,
+    City,
+    Flat,
+    Line,
+    Milk,
+    Nested,
+    Order,
+)
+
+CASES = {}
+
+
+def case(group):
+    """
+    Register the decorated setup function as the case `<group>.<function name>`.
+    :type group: str
+    """
+
+    def register(setup):
+        CASES['%s.%s' % (group, setup.__name__)] = setup
+        return setup
+
+    return register
+
+
+@case('construct')
+def flat_strict():
+    return lambda: Flat(FLAT)
+
+
+@case('construct')
+def flat_non_strict():
+    data = {'id': 1, 'name': 'evil-jenkins'}
+    return lambda: Flat(data, strict=False)
+
+
+@case('construct')
+def nested_strict():
+    return lambda: Nested(NESTED)
+
+
+@case('construct')
+def nested_from_instances():
+    data = {'id': 1, 'flat': Flat(FLAT), 'address': Address(ADDRESS)}
+    return lambda: Nested(data)
+
+
+@case('construct')
+def managed_list_50():
+    return lambda: Order(ORDER)
+
+
+@case('construct')
+def primitive_list_1000():
+    restriction = PrimitiveManagedList(float, compact=True)
+    values = [i / 4 for i in range(1000)]
+    return lambda: restriction(values)
+
+
+@case('construct')
+def from_many_flat_100():
+    records = [dict(FLAT, id=i) for i in range(100)]
+    return lambda: Flat.from_many(records)
+
+
+@case('construct')
+def validate_columns_flat_100():
+    columns = {k: [v] * 100 for k, v in FLAT.items()}
+    columns['id'] = list(range(100))
+    return lambda: Flat.validate_columns(columns)
+
+
+@case('construct')
+def class_declaration():
+    def declare():
+        class Declared(DataObject):
+            _restrictions = {'id': R.INT, 'name': R.NULL_STR, 'status': R('a', 'b'), 'address': Address}
+
+        return Declared
+
+    return declare
+
+
+@case('setitem')
+def flat_setitem():
+    flat = Flat(FLAT)
+
+    def setitem():
+        flat['status'] = 'inactive'
+
+    return setitem
+
+
+@case('setitem')
+def validator_validated_key():
+    city = City(CITY)
+
+    def setitem():
+        city['city'] = 'Dallas'
+
+    return setitem
+
+
+@case('setitem')
+def validator_other_key():
+    city = City(CITY)
+
+    def setitem():
+        city['population'] = 1
+
+    return setitem
+
+
+@case('setitem')
+def ordered_list_insert_1000():
+    class Ledger(DataObject):
+        _restrictions = {'lines': OrderedManagedList(Line, key=lambda line: line.quantity)}
+
+    ledger = Ledger({'lines': [{'sku': 'SKU-%04d' % i, 'quantity': i, 'price': 1.5} for i in range(1000)]})
+    line = Line({'sku': 'SKU-NEW', 'quantity': 500, 'price': 1.5})
+    # NOTE: The line is inserted after the existing line of the same quantity, mid-list; deleting it there restores
+    # the list, so every call bisects into the same 1000 lines.
+    index = bisect_right(ledger.lines, line.quantity, key=lambda line: line.quantity)
+
+    def insert():
+        ledger.lines.add(line)
+        del ledger.lines[index]
+
+    return insert
+
+
+@case('dynamic')
+def dynamic_init():
+    return lambda: Breakfast(BREAKFAST)
+
+
+@case('dynamic')
+def dynamic_setitem():
+    breakfast = Breakfast(BREAKFAST)
+    milk = Milk({'flavor': 'normal'})
+
+    def setitem():
+        breakfast['item_metadata'] = milk
+
+    return setitem
+
+
+@case('datetime')
+def mgd_datetime_parse():
+    restriction = MgdDatetime.datetime()
+    return lambda: restriction('2026-10-17T12:30:00')
+
+
+@case('datetime')
+def mgd_datetime_manage_many_100():
+    restriction = MgdDatetime.datetime()
+    values = ['2026-10-17T12:%02d:00' % i for i in range(60)] + ['2026-10-18T%02d:30:00' % i for i in range(24)]
+    values += ['2026-10-19T00:00:%02d' % i for i in range(16)]
+    return lambda: restriction.manage_many(values)
+
+
+@case('serialize')
+def flat_repr():
+    flat = Flat(FLAT)
+    return lambda: repr(flat)
+
+
+@case('serialize')
+def order_to_json():
+    order = Order(ORDER)
+    return order.to_json
+
+
+@case('serialize')
+def order_json_dumps():
+    order = Order(ORDER)
+    return lambda: json.dumps(order, cls=MyJSONEncoder)
+
+
+@case('schema')
+def order_schema():
+    return lambda: Order.schema
+
+
+@case('schema')
+def nested_es_restrictions():
+    restriction = R(Nested, type(None))
+    return lambda: restriction.es_restrictions
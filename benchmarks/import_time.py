@@ -0,0 +1,105 @@
+"""
+Benchmark importing a module declaring many DataObject classes, with and without the code cache. Validators and
+serializers are compiled on first use, so the timing includes compiling both for every class once imported.
+
+Each import runs in a fresh interpreter:
+    - uncached: `DO_PY_CODE_CACHE` unset.
+    - cold: empty cache directory; every class is compiled and written to the cache.
+    - warm: the cache populated by the cold run.
+
+Usage:
+    python benchmarks/import_time.py [--classes 300] [--repeat 5]
+:date_created: 2026-10-17
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLASS_TEMPLATE = """
+class Item{n}(DataObject):
+    _restrictions = {{'id': R.INT, 'code': R('a', 'b', 'c'), 'price': R.NULL_FLOAT}}
+
+
+class Order{n}(DataObject):
+    _restrictions = {{
+        'id': R.INT,
+        'name': R.NULL_STR,
+        'created': MgdDatetime.datetime(),
+        'item': Item{n},
+        'lines': ManagedList(Item{n}),
+        'paid': R.BOOL,
+    }}
+"""
+
+TIMER = """
+import time
+start = time.perf_counter()
+import models
+for cls in models.classes:
+    cls._compile_validator_()
+    cls._compile_serializer_()
+print(time.perf_counter() - start)
+"""
+
+
+def write_models(directory, classes):
+    """
+    Write a module declaring `2 * classes` DataObject classes.
+    """
+    lines = [
+        'from do_py import DataObject, R',
+        'from do_py.common.managed_datetime import MgdDatetime',
+        'from do_py.common.managed_list import ManagedList',
+    ]
+    lines.extend(CLASS_TEMPLATE.format(n=n) for n in range(classes // 2))
+    lines.append('classes = [%s]' % ', '.join('Item%s, Order%s' % (n, n) for n in range(classes // 2)))
+    with open(os.path.join(directory, 'models.py'), 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def import_time(directory, cache_path):
+    """
+    :return: Seconds taken to import the models module, and compile its classes, in a new interpreter.
+    :rtype: float
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, ROOT]), PYTHONDONTWRITEBYTECODE='1')
+    env.pop('DO_PY_CODE_CACHE', None)
+    if cache_path is not None:
+        env['DO_PY_CODE_CACHE'] = cache_path
+    out = subprocess.run([sys.executable, '-c', TIMER], env=env, capture_output=True, text=True, check=True).stdout
+    return float(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--classes', type=int, default=300, help='Number of DataObject classes declared.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of imports timed per scenario.')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='do_py_bench_')
+    cache_path = os.path.join(directory, 'code_cache')
+    try:
+        write_models(directory, args.classes)
+        results = {'uncached': [], 'cold': [], 'warm': []}
+        for _ in range(args.repeat):
+            results['uncached'].append(import_time(directory, None))
+            shutil.rmtree(cache_path, ignore_errors=True)
+            results['cold'].append(import_time(directory, cache_path))
+            results['warm'].append(import_time(directory, cache_path))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print('Importing %s DataObject classes (median of %s):' % (args.classes, args.repeat))
+    for scenario, timings in results.items():
+        print('  %-9s %8.1f ms' % (scenario, statistics.median(timings) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+DataObject classes and records benchmarked by `benchmarks.cases`.
+:date_created: 2026-10-17
+"""
+
+from do_py import DataObject, R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.common.managed_list import ManagedList
+from do_py.data_object.dynamic_restrictions import dynamic_restriction_mixin
+from do_py.data_object.validator import Validator
+
+
+class Flat(DataObject):
+    _restrictions = {
+        'id': R.INT,
+        'name': R.STR,
+        'email': R.NULL_STR,
+        'status': R('active', 'inactive', 'banned'),
+        'score': R.NULL_FLOAT,
+        'verified': R.BOOL,
+    }
+
+
+class Address(DataObject):
+    _restrictions = {'street': R.STR, 'city': R.STR, 'zip': R.NULL_STR}
+
+
+class Nested(DataObject):
+    _restrictions = {'id': R.INT, 'flat': Flat, 'address': R(Address, type(None))}
+
+
+class Line(DataObject):
+    _restrictions = {'sku': R.STR, 'quantity': R.INT, 'price': R.FLOAT}
+
+
+class Order(DataObject):
+    _restrictions = {
+        'id': R.INT,
+        'created': MgdDatetime.datetime(),
+        'address': Address,
+        'lines': ManagedList(Line),
+    }
+
+
+class City(Validator):
+    _restrictions = {'city': R('Dallas', 'Los Angeles'), 'state': R('TX', 'CA'), 'population': R.NULL_INT}
+    _validate_keys = ('city', 'state')
+
+    def _validate(self):
+        assert (self.city, self.state) in {('Dallas', 'TX'), ('Los Angeles', 'CA')}, 'City and state mismatch.'
+
+
+class Milk(DataObject):
+    _restrictions = {'flavor': R('chocolate', 'normal')}
+
+
+class Cereal(DataObject):
+    _restrictions = {'brand': R('frosted-flakes', 'cheerios')}
+
+
+class Breakfast(dynamic_restriction_mixin('item', 'item_metadata', milk=Milk, cereal=Cereal)):
+    _restrictions = {'item': R('milk', 'cereal'), 'item_metadata': R()}
+
+
+FLAT = {
+    'id': 1,
+    'name': 'evil-jenkins',
+    'email': 'jenkins@example.com',
+    'status': 'active',
+    'score': 0.5,
+    'verified': True,
+}
+ADDRESS = {'street': '1 Main St', 'city': 'Dallas', 'zip': '75201'}
+NESTED = {'id': 1, 'flat': FLAT, 'address': ADDRESS}
+ORDER = {
+    'id': 1,
+    'created': '2026-10-17T12:30:00',
+    'address': ADDRESS,
+    'lines': [{'sku': 'SKU-%03d' % i, 'quantity': i, 'price': i * 1.5} for i in range(50)],
+}
+CITY = {'city': 'Dallas', 'state': 'TX', 'population': 1300000}
+BREAKFAST = {'item': 'milk', 'item_metadata': {'flavor': 'chocolate'}}
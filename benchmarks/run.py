@@ -0,0 +1,114 @@
+"""
+Run the benchmark cases, optionally saving the results as a baseline or diffing them against one.
+
+Each case is timed with `timeit`: the number of loops is calibrated to last at least 0.2s, and the fastest of
+`--repeat` runs is reported per call, which is the least noisy estimate of the cost of the code itself.
+
+Usage:
+    python -m benchmarks.run                                    # Print the results.
+    python -m benchmarks.run --save benchmarks/baseline.json    # Store the results as a baseline.
+    python -m benchmarks.run --compare benchmarks/baseline.json # Exit with 1 when a case regressed beyond threshold.
+    python -m benchmarks.run -k serialize                       # Only run cases whose name contains "serialize".
+:date_created: 2026-10-17
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+
+from .cases import CASES
+
+
+def measure(setup, repeat=5):
+    """
+    :param setup: Registered case, returning the callable to time.
+    :type setup: types.FunctionType
+    :type repeat: int
+    :return: Timing of one call in nanoseconds, along with the number of loops it was measured over.
+    :rtype: dict
+    """
+    timer = timeit.Timer(setup())
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=loops))
+    return {'ns_per_call': round(best / loops * 1e9, 1), 'loops': loops}
+
+
+def run(names, repeat=5):
+    """
+    :type names: list[str]
+    :type repeat: int
+    :return: Results in the format stored in baselines.
+    :rtype: dict
+    """
+    results = {}
+    for name in names:
+        results[name] = measure(CASES[name], repeat=repeat)
+        print('%-40s %12.1f ns' % (name, results[name]['ns_per_call']))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Print the ratio of each case's timing to the baseline's.
+    :type current: dict
+    :type baseline: dict
+    :param threshold: Ratio above which a case counts as a regression.
+    :type threshold: float
+    :return: Names of the cases that regressed.
+    :rtype: list[str]
+    """
+    regressions = []
+    print('\n%-40s %12s %12s %8s' % ('case', 'baseline', 'current', 'ratio'))
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            print('%-40s %12s %12.1f %8s' % (name, '-', result['ns_per_call'], 'new'))
+            continue
+        ratio = result['ns_per_call'] / previous['ns_per_call']
+        flag = ''
+        if ratio > threshold:
+            regressions.append(name)
+            flag = '  REGRESSED'
+        print('%-40s %12.1f %12.1f %8.2f%s' % (name, previous['ns_per_call'], result['ns_per_call'], ratio, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='keyword', default='', help='Only run cases whose name contains this.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs per case.')
+    parser.add_argument('--save', metavar='PATH', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', metavar='PATH', help='Diff the results against this JSON baseline.')
+    parser.add_argument('--threshold', type=float, default=1.25, help='Slowdown ratio counted as a regression.')
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.keyword in name]
+    current = run(names, repeat=args.repeat)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print('\n%s case(s) regressed beyond %sx: %s' % (len(regressions), args.threshold, ', '.join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,10 +3,12 @@ Custom Abstract Base Classes to implement Restrictions. Developed for DataObject
 :date_created: 2018-12-05
 """
 
+from types import BuiltinFunctionType
+
 from ..utils import classproperty
 from .constants import ConstABCR
 from .messages import SystemMessages
-from .utils import already_declared, compare_cls
+from .utils import already_declared, compare_cls, object_new
 
 
 class ABCRestrictionMeta(type):
@@ -25,6 +27,40 @@ class ABCRestrictionMeta(type):
         """
         return {k: getattr(k, ConstABCR.required, ()) for k in cls._abc_classes}
 
+    @staticmethod
+    def _base_new(parents):
+        """
+        Find the builtin __new__ that ultimately allocates instances for a class with these parents.
+        :param parents: Bases of the class being declared.
+        :type parents: tuple
+        :rtype: builtin_function_or_method
+        """
+        for p in parents:
+            for c in p.__mro__:
+                fn = c.__dict__.get(ConstABCR.new)
+                if isinstance(fn, BuiltinFunctionType):
+                    return object_new if fn is object.__new__ else fn
+        return object_new
+
+    @classmethod
+    def _is_default_new(mcs, parents):
+        """
+        Check that no class in the hierarchy explicitly declares __new__. The __new__ injected by this metaclass
+        counts as default unless it wraps an explicitly declared __new__.
+        :param parents: Bases of the class being declared.
+        :type parents: tuple
+        :rtype: bool
+        """
+        for p in parents:
+            for c in p.__mro__:
+                fn = c.__dict__.get(ConstABCR.new)
+                while fn is not None and not isinstance(fn, BuiltinFunctionType):
+                    fn = getattr(fn, '__func__', fn)
+                    if not hasattr(fn, '_fn_new_'):
+                        return False
+                    fn = fn._fn_new_
+        return True
+
     def __new__(mcs, cls_name, parents, namespace):
         """
 
@@ -55,11 +91,19 @@ class ABCRestrictionMeta(type):
                     for p_ in parents:
                         if hasattr(p_, '__new__'):
                             p_.__new__(this_cls, *args, **kwargs)  # Unsure if trashing returned instance is a problem
-                    return dict.__new__(this_cls, *args, **kwargs)
+                    return base_new(this_cls, *args, **kwargs)
 
+            this_new._fn_new_ = fn_new
             return this_new
 
-        namespace[ConstABCR.new] = nested_new(namespace.get(ConstABCR.new))
+        base_new = mcs._base_new(parents)
+        is_leaf = ConstABCR.required not in namespace and not namespace.get(ConstABCR.is_abstract)
+        if is_leaf and namespace.get(ConstABCR.new) is None and mcs._is_default_new(parents):
+            # Leaf fast path: leaves are never abstract and no class in the hierarchy customizes __new__, so
+            # instantiation is delegated straight to the builtin __new__ of the base type, i.e. `dict.__new__`.
+            namespace[ConstABCR.new] = base_new
+        else:
+            namespace[ConstABCR.new] = nested_new(namespace.get(ConstABCR.new))
 
         if ConstABCR.required in namespace:
             # Root-type and Node-type classes define namespace requirements for its children.
@@ -82,7 +126,7 @@ class ABCRestrictionMeta(type):
             roots = []
             nodes = []
             leaves = []
-            all_parents = {k for k in list(parents) + sum([p.mro() for p in parents], [])}
+            all_parents = {c for p in parents for c in p.__mro__}
             for c in all_parents:
                 if getattr(c, ConstABCR.state, None) == ConstABCR.root:
                     roots.append(c)
@@ -95,7 +139,7 @@ class ABCRestrictionMeta(type):
             #   1. This leaf's namespace
             #   2. One of its leaf-style parents' namespaces
             #   3. One of its node-style parents' namespaces
-            required_attrs = set(sum([getattr(p, ConstABCR.required, ()) for p in roots + nodes], ()))
+            required_attrs = {attr for p in roots + nodes for attr in getattr(p, ConstABCR.required, ())}
             for attr in required_attrs:
                 # Check that the required attribute is defined in this class or a leaf that is a parent of this class.
                 assert any([hasattr(p, attr) for p in leaves + nodes]) or attr in namespace, (
@@ -103,7 +147,7 @@ class ABCRestrictionMeta(type):
                 )
 
             # Validate that the value given to a unique attribute is unique system-wide for that attribute.
-            unique_attrs = set(sum([getattr(p, ConstABCR.unique, ()) for p in roots + nodes], ()))
+            unique_attrs = {attr for p in roots + nodes for attr in getattr(p, ConstABCR.unique, ())}
             for attr in unique_attrs:
                 for leaf in mcs._unique_attrs.get(attr, []):
                     if attr not in namespace:
@@ -169,6 +213,9 @@ class ABCRestrictions:
             namespace = dict(cls_ref.__dict__)
             namespace.pop('__dict__', None)
             namespace.pop('__weakref__', None)
+            # Slot descriptors are recreated from __slots__
+            for slot in namespace.get('__slots__', ()):
+                namespace.pop(slot, None)
 
             # Check if required attributes passed in are new
             r = already_declared(cls_ref, ConstABCR.required, required_attrs)
@@ -2,8 +2,11 @@
 :date_created: 2020-06-28
 """
 
+from array import array
+from bisect import bisect_right
+
 from do_py.common import R
-from do_py.data_object.restriction import ManagedRestrictions
+from do_py.data_object.restriction import ESEncoder, ManagedRestrictions
 from do_py.exceptions import RestrictionError
 
 
@@ -13,6 +16,8 @@ class ManagedList(ManagedRestrictions):
     """
 
     _restriction = R(list, type(None))
+    # NOTE: Type of the managed value.
+    container = list
 
     @property
     def schema_value(self):
@@ -34,17 +39,146 @@ class ManagedList(ManagedRestrictions):
 
     def manage(self):
         if self.data is not None:
-            items = []
-            for item in self.data:
-                items.append(item if type(item) == self.obj_cls else self.obj_cls(item))
-            self.data = items
+            # NOTE: Items that are already instances of obj_cls are validated; they are kept as is.
+            obj_cls = self.obj_cls
+            self.data = [item if type(item) is obj_cls else obj_cls(item) for item in self.data]
         else:
             if not self.nullable:
                 raise RestrictionError.bad_data(self.data, self._restriction.allowed)
 
 
-# TODO: Unit tests
+class SortedList(list):
+    """
+    List of DataObjects kept sorted as items are added, which is what an OrderedManagedList stores.
+
+    `add`, `append`, `extend` and `+=` validate new items against obj_cls, as ManagedList does, and keep the list
+    sorted without sorting it again: a single item is inserted at its bisected position, and a run of items is sorted
+    on its own and merged in. Items comparing equal to items already in the list are placed after them, as a stable
+    sort would. `insert(index, item)`, setting items by index, `*=`, `sort` and `reverse` are plain list operations:
+    they neither validate nor keep the order, and mark the list as modified. A modified list is validated and sorted
+    again when it is assigned to a key.
+
+    Copies and pickles of a SortedList are plain lists, as for the rest of a DataObject's data; the restriction builds
+    a SortedList again when they are assigned to a key.
+
+    Example:
+        feed = Feed(data)  # 'events': OrderedManagedList(Event, key=lambda e: e.created)
+        feed.events.add({'id': 7, 'created': ...})
+    """
+
+    __slots__ = ('obj_cls', 'key', 'descending', 'modified')
+
+    def __init__(self, obj_cls, iterable=(), key=None, reverse=False):
+        """
+        :param obj_cls: DataObject class of the items.
+        :type obj_cls: DataObject
+        :param iterable: Initial items, in any order.
+        :param key: See `list.sort`.
+        :type key: function
+        :param reverse: See `list.sort`.
+        :type reverse: bool
+        """
+        super(SortedList, self).__init__()
+        self.obj_cls = obj_cls
+        self.key = key
+        # NOTE: Not named reverse, which is the list method.
+        self.descending = reverse
+        self.modified = False
+        self.extend(iterable)
+
+    def __reduce__(self):
+        # NOTE: key is usually a lambda, which cannot be pickled.
+        return list, (list(self),)
+
+    def _copy(self):
+        """
+        :return: A SortedList holding the same items, without validating or sorting them again.
+        :rtype: SortedList
+        """
+        copied = SortedList(self.obj_cls, key=self.key, reverse=self.descending)
+        list.extend(copied, self)
+        return copied
+
+    def _validated(self, item):
+        """
+        :return: item as an instance of obj_cls. Instances of obj_cls are already validated; they are kept as is.
+        :rtype: DataObject
+        """
+        return item if type(item) is self.obj_cls else self.obj_cls(item)
+
+    def _position(self, item):
+        """
+        :return: Index to insert item at, after any item comparing equal to it.
+        :rtype: int
+        """
+        if not self.descending:
+            return bisect_right(self, item if self.key is None else self.key(item), key=self.key)
+        # NOTE: bisect only searches ascending sequences.
+        k = item if self.key is None else self.key(item)
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = self[mid] if self.key is None else self.key(self[mid])
+            if other < k:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def add(self, item):
+        """
+        Validate item and insert it at its sorted position. O(log n) comparisons.
+        """
+        item = self._validated(item)
+        list.insert(self, self._position(item), item)
+
+    append = add
+
+    def extend(self, iterable):
+        """
+        Validate the items of iterable and merge them in.
+        """
+        run = [self._validated(item) for item in iterable]
+        # NOTE: Bisecting costs O(log n) comparisons per item; sorting merges the run in with O(n) key calls.
+        if len(run) * len(self).bit_length() < len(self):
+            for item in run:
+                list.insert(self, self._position(item), item)
+        else:
+            list.extend(self, run)
+            list.sort(self, key=self.key, reverse=self.descending)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def insert(self, index, item):
+        self.modified = True
+        list.insert(self, index, item)
+
+    def __setitem__(self, index, value):
+        self.modified = True
+        list.__setitem__(self, index, value)
+
+    def __imul__(self, n):
+        self.modified = True
+        return list.__imul__(self, n)
+
+    def sort(self, *, key=None, reverse=False):
+        self.modified = True
+        list.sort(self, key=key, reverse=reverse)
+
+    def reverse(self):
+        self.modified = True
+        list.reverse(self)
+
+
 class OrderedManagedList(ManagedList):
+    """
+    ManagedList stored as a SortedList, so that it stays sorted as items are added. See `SortedList`.
+    """
+
+    container = SortedList
+
     def __init__(self, obj_cls, nullable=False, key=None, reverse=False):
         """
         :param obj_cls: DataObject class reference to wrap each object in list.
@@ -58,8 +192,97 @@ class OrderedManagedList(ManagedList):
 
     def manage(self):
         """
-        Sort the data list after ManagedList does its work.
+        Validate and sort the data list. An unmodified SortedList of this restriction is already validated and sorted;
+        it is only copied, so that DataObjects never share their list.
         """
-        super(OrderedManagedList, self).manage()
-        if self.data is not None:
-            self.data = sorted(self.data, key=self.key, reverse=self.reverse)
+        data = self.data
+        if data is not None:
+            if (
+                type(data) is SortedList
+                and data.obj_cls is self.obj_cls
+                and data.key is self.key
+                and data.descending is self.reverse
+                and not data.modified
+            ):
+                self.data = data._copy()
+                return
+            self.data = SortedList(self.obj_cls, data, key=self.key, reverse=self.reverse)
+        elif not self.nullable:
+            raise RestrictionError.bad_data(data, self._restriction.allowed)
+
+
+class PrimitiveManagedList(ManagedRestrictions):
+    """
+    Use this when you need a restriction for a list of int, float or bool values, e.g. a long numeric series.
+
+    Items are validated in bulk: the set of their types is checked once, rather than each item going through a
+    restriction. As with `R.INT` and `R.FLOAT`, types must match exactly; bools are not ints and ints are not floats.
+
+    With compact=True, int and float items are stored in an `array.array` of 64-bit machine values instead of a list,
+    i.e. 8 bytes per item rather than a list slot plus a boxed Python object. Ints that do not fit in 64 bits are not
+    allowed then. An array with the same typecode is kept as is, as it cannot hold anything else.
+    """
+
+    _restriction = R(list, type(None))
+    # NOTE: 64-bit machine values. Bools have no typecode reading back as bool, so bool lists are not compacted.
+    typecodes = {int: 'q', float: 'd'}
+
+    @property
+    def schema_value(self):
+        """
+        :rtype: list[str]
+        """
+        return [self.item_type.__name__]
+
+    @property
+    def es_restrictions(self):
+        """
+        ES fields hold arrays of their type, so a list is mapped like one of its items.
+        :rtype: dict
+        """
+        return ESEncoder.default(self.item_type)
+
+    def __init__(self, item_type, nullable=False, compact=False):
+        """
+        :param item_type: The type of each value in the list: int, float or bool.
+        :type item_type: type
+        :param nullable: Valid values are a list of item_type values or a NoneType.
+        :type nullable: bool
+        :param compact: Store values in an `array.array`. See class docstring.
+        :type compact: bool
+        """
+        assert item_type in (int, float, bool), 'Unsupported item_type(=%s)' % item_type
+        assert not compact or item_type in self.typecodes, 'item_type(=%s) cannot be compacted' % item_type
+        super(PrimitiveManagedList, self).__init__()
+        self.item_type = item_type
+        self.nullable = nullable
+        self.typecode = self.typecodes[item_type] if compact else None
+
+    def manage(self):
+        data = self.data
+        if data is None:
+            if not self.nullable:
+                raise RestrictionError.bad_data(data, self._restriction.allowed)
+            return
+
+        if type(data) is array:
+            if data.typecode == self.typecode:
+                return
+            data = data.tolist()
+        elif type(data) is not list and type(data) is not tuple:
+            raise RestrictionError.bad_data(data, self._restriction.allowed)
+
+        item_type = self.item_type
+        if not set(map(type, data)) <= {item_type}:
+            for item in data:
+                if type(item) is not item_type:
+                    raise RestrictionError.bad_data(item, item_type)
+
+        if self.typecode is None:
+            self.data = list(data)
+        else:
+            try:
+                self.data = array(self.typecode, data)
+            except OverflowError as e:
+                item = next(item for item in data if not -(2**63) <= item < 2**63)
+                raise RestrictionError.bad_data(item, 'int64') from e
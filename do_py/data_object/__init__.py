@@ -1,10 +1,46 @@
 import copy
 
-from do_py.abc import ABCRestrictionMeta, ABCRestrictions, SystemMessages, classproperty
-from do_py.data_object.restriction import Restriction
+from do_py.abc import ABCRestrictions, SystemMessages, classproperty
+from do_py.abc.constants import ConstABCR
+from do_py.data_object.restriction import Restriction, restriction_cache
 from do_py.exceptions import DataObjectError, RestrictionError
 
+from . import batch
+from .collect import collect_errors as _collect_errors
+from .columns import validate_columns as _validate_columns
+from .compiler import compile_validator
+from .instrumentation import instrumentation as _instrumentation
 from .restricted_dict import RestrictedDictMixin
+from .schema_registry import build_schema, schema_registry
+from .serializer import compile_serializer
+
+
+def _validate_keys(cls, _restrictions, d, strict):
+    """
+    Generic implementation of `DataObject._validate_data`, for restrictions no validator was compiled for.
+    :rtype: dict
+    """
+    _dict = dict()
+    d = {} if d is None else d
+    # NOTE: Unrestricted keys are never allowed.
+    for k in list(d.keys()):
+        if k not in _restrictions:
+            raise DataObjectError.from_unknown_key(k, cls)
+
+    # NOTE: Use default in strict for missing keys in data.
+    for k, v in _restrictions.items():
+        if k not in d:
+            if strict:
+                raise DataObjectError.from_required_key(k, cls)
+            else:
+                _dict[k] = v.default
+        else:
+            try:
+                _dict[k] = v(d[k], strict=strict)
+            except RestrictionError as e:
+                raise DataObjectError.from_restriction_error(k, cls, e) from e
+
+    return _dict
 
 
 @ABCRestrictions.require('_restrictions')
@@ -38,12 +74,16 @@ class DataObject(RestrictedDictMixin):
     :attribute _restrictions: dictionary defining data structure and valid values.
     """
 
-    _schema = None
+    _validator_ = None
+    _serializer_ = None
 
     @classmethod
     def __compile__(cls):
         """
         This enforces restrictions. We do not want users to instantiate this class.
+
+        The validator and the JSON serializer specialized for this class are generated on first use, see
+        `_compile_validator_` and `_compile_serializer_`.
         """
         assert type(cls._restrictions) is dict, SystemMessages.REQUIRED_FOR % ('_restrictions', cls.__name__)
         for k in cls._restrictions:
@@ -53,9 +93,38 @@ class DataObject(RestrictedDictMixin):
                 cls._restrictions[k] = Restriction.legacy(cls._restrictions[k])
             except RestrictionError as e:
                 raise DataObjectError.from_restriction_error(k, cls, e) from e
+            # NOTE: Restrictions referenced by a class are never evicted from the restriction cache.
+            restriction_cache.add_owner(cls._restrictions[k], cls)
+        schema_registry.invalidate(cls)
+
+    @classmethod
+    def _compile_validator_(cls):
+        """
+        The validator compiled for this class, see `do_py.data_object.compiler`. It is compiled on first use rather than
+        when the class is declared, and memoized in `schema_registry` until the class is invalidated.
+        :return: The validator as a staticmethod, or None when this class is not a leaf class.
+        :rtype: staticmethod or None
+        """
+        if getattr(cls, ConstABCR.state, None) != ConstABCR.leaf:
+            return None
+        return schema_registry.compiled(cls, schema_registry.VALIDATOR, lambda c: compile_validator(c, c._restrictions))
 
     @classmethod
-    def _validate_data(cls, _restrictions, d, strict=True):
+    def _compile_serializer_(cls):
+        """
+        The JSON serializer compiled for this class, see `do_py.data_object.serializer`. It is compiled on first use,
+        as the validator is. See `_compile_validator_`.
+        :return: The serializer as a staticmethod, or None when this class is not a leaf class.
+        :rtype: staticmethod or None
+        """
+        if getattr(cls, ConstABCR.state, None) != ConstABCR.leaf:
+            return None
+        return schema_registry.compiled(
+            cls, schema_registry.SERIALIZER, lambda c: compile_serializer(c, c._restrictions)
+        )
+
+    @classmethod
+    def _validate_data(cls, _restrictions, d, strict=True, collect_errors=False):
         """
         Validate data as per Data Object (DO) restrictions.
 
@@ -70,50 +139,149 @@ class DataObject(RestrictedDictMixin):
         Data Integrity:
         Data is validated in both strict and non-strict mode.
 
+        Error Collection:
+        By default, the first failure is raised. When collect_errors is set, data that fails validation is validated once
+        more to collect every failure, nested ones included, into a single DataObjectError. See
+        `do_py.data_object.collect`.
+
+        Instrumentation:
+        Counts and timings of validation are recorded per class and key once instrumentation is enabled. See
+        `do_py.data_object.instrumentation`.
+
         :param _restrictions: DO restrictions
         :type _restrictions: dict
         :param d: Data
         :type d: dict
         :param strict: strict vs non-strict initialization.
         :type strict: bool
+        :param collect_errors: Raise all failures at once. The `errors` attribute of the DataObjectError raised holds
+            `(path, error)` for each failure.
+        :type collect_errors: bool
         :return: Validated data. Some restrictions may further apply data standardization.
         :rtype: dict
         :raises DataObjectError: When a key not defined in _restrictions is passed in.
         :raises DataObjectError: When an invalid value is passed in.
         """
-        _dict = dict()
-        d = {} if d is None else d
-        # NOTE: Unrestricted keys are never allowed.
-        for k in list(d.keys()):
-            if k not in _restrictions:
-                raise DataObjectError.from_unknown_key(k, cls)
-
-        # NOTE: Use default in strict for missing keys in data.
-        for k, v in _restrictions.items():
-            if k not in d:
-                if strict:
-                    raise DataObjectError.from_required_key(k, cls)
-                else:
-                    _dict[k] = v.default
-            else:
-                try:
-                    _dict[k] = v(d[k], strict=strict)
-                except RestrictionError as e:
-                    raise DataObjectError.from_restriction_error(k, cls, e) from e
+        if collect_errors:
+            try:
+                return cls._validate_data(_restrictions, d, strict=strict)
+            except DataObjectError as e:
+                errors = _collect_errors(cls, _restrictions, d, strict=strict)
+                if not errors:
+                    raise
+                raise DataObjectError.from_errors(cls, errors) from e
 
-        return _dict
+        # NOTE: The compiled validator only applies to the restrictions it was compiled for. Instance level
+        # restrictions, i.e. dynamic restrictions, use the generic implementation below.
+        validator = None
+        if _restrictions is cls._restrictions:
+            validator = cls.__dict__.get('_validator_') or cls._compile_validator_()
+        if validator is not None:
+            if _instrumentation.enabled:
+                # NOTE: Instrumentation records each key separately, against the restrictions the validator was
+                # compiled for.
+                return _instrumentation.validate(cls, _validate_keys, validator.__func__._restrictions_, d, strict)
+            return validator.__func__(cls, d, strict)
+        elif _instrumentation.enabled:
+            return _instrumentation.validate(cls, _validate_keys, _restrictions, d, strict)
 
-    def __init__(self, data=None, strict=True):
+        return _validate_keys(cls, _restrictions, d, strict)
+
+    def __init__(self, data=None, strict=True, collect_errors=False):
         """
         Initialize DataObject.
         :param data: Initialize to this dictionary.
         :param strict: See Strict vs Non-strict initialization comments in _validate_data.
+        :param collect_errors: See Error Collection comments in _validate_data.
         """
         self._strict = strict
-        super(DataObject, self).__init__(self._validate_data(self._restrictions, data, strict=strict))
+        super(DataObject, self).__init__(
+            self._validate_data(self._restrictions, data, strict=strict, collect_errors=collect_errors)
+        )
         # NOTE: Now that we are done loading, we go back to strict mode
         self._strict = True
 
+    @classmethod
+    def iter_many(cls, iterable, strict=True, on_error=batch.OnError.RAISE, errors=None, collect_errors=False):
+        """
+        Lazily build an instance for every record in iterable. Per-class lookups are resolved once for the whole
+        batch rather than once per record.
+        :param iterable: Records to initialize instances with.
+        :param strict: See Strict vs Non-strict initialization comments in _validate_data.
+        :type strict: bool
+        :param on_error: How invalid records are handled. See `do_py.data_object.batch.OnError`.
+        :type on_error: str
+        :param errors: Receives `(index, DataObjectError)` for each invalid record when on_error is 'collect'.
+        :type errors: list
+        :param collect_errors: Each error reports all failures of its record. See Error Collection comments in
+            _validate_data.
+        :type collect_errors: bool
+        :rtype: collections.abc.Iterator
+        """
+        # NOTE: batch.iter_many is a generator, which would only check its arguments once iterated.
+        batch.OnError.check(on_error, errors)
+        return batch.iter_many(
+            cls, iterable, strict=strict, on_error=on_error, errors=errors, collect_errors=collect_errors
+        )
+
+    @classmethod
+    def from_many(cls, iterable, strict=True, on_error=batch.OnError.RAISE, errors=None, collect_errors=False):
+        """
+        Build an instance for every record in iterable. See `iter_many`.
+
+        Example:
+            errors = []
+            rows = A.from_many(cursor, on_error='collect', errors=errors)
+            # errors: [(3, DataObjectError("A: Key 'id' required in data."))]
+        :rtype: list
+        """
+        return list(
+            cls.iter_many(iterable, strict=strict, on_error=on_error, errors=errors, collect_errors=collect_errors)
+        )
+
+    @classmethod
+    def iter_ndjson(cls, fileobj, strict=True, on_error=batch.OnError.RAISE, errors=None, **kwargs):
+        """
+        Lazily build an instance for every line of a newline-delimited JSON file. See `do_py.io.iter_ndjson`.
+
+        Example:
+            with open('accounts.ndjson', 'rb') as f:
+                for account in Account.iter_ndjson(f, on_error='skip'):
+                    ...
+        :rtype: collections.abc.Iterator
+        """
+        # NOTE: do_py.io builds on this package.
+        from do_py.io import iter_ndjson
+
+        # NOTE: iter_ndjson is a generator, which would only check its arguments once iterated.
+        batch.OnError.check(on_error, errors)
+        return iter_ndjson(cls, fileobj, strict=strict, on_error=on_error, errors=errors, **kwargs)
+
+    @classmethod
+    def validate_columns(cls, columns, strict=True, on_error=batch.OnError.RAISE, errors=None, as_rows=False):
+        """
+        Validate data held column-wise, applying each restriction once per column rather than once per record. Errors
+        are reported per row, as `from_many` reports them per record. See `do_py.data_object.columns`.
+
+        Example:
+            errors = []
+            columns = A.validate_columns({'id': [1, 2, 'x'], 'name': ['a', 'b', 'c']}, on_error='collect', errors=errors)
+            # columns: {'id': [1, 2], 'name': ['a', 'b']}
+            # errors: [(2, DataObjectError(...))]
+        :param columns: `{key: values}`, every column holding one value per row.
+        :type columns: dict
+        :param strict: See Strict vs Non-strict initialization comments in _validate_data.
+        :type strict: bool
+        :param on_error: How invalid rows are handled. See `do_py.data_object.batch.OnError`.
+        :type on_error: str
+        :param errors: Receives `(row, DataObjectError)` for each invalid row when on_error is 'collect'.
+        :type errors: list
+        :param as_rows: Return an iterator lazily building an instance per valid row instead of the validated columns.
+        :type as_rows: bool
+        :rtype: dict or collections.abc.Iterator
+        """
+        return _validate_columns(cls, columns, strict=strict, on_error=on_error, errors=errors, as_rows=as_rows)
+
     def __call__(self, data=None, strict=True):
         """
         This re-initializes the data object.
@@ -129,6 +297,18 @@ class DataObject(RestrictedDictMixin):
         """
         super(DataObject, self).__setitem__(item, self._restrictions[item](value))
 
+    def to_json(self):
+        """
+        Serialize to JSON with the serializer compiled for this class. The output is identical to
+        `json.dumps(self, cls=MyJSONEncoder)`.
+        :rtype: str
+        """
+        cls = type(self)
+        return (cls.__dict__.get('_serializer_') or cls._compile_serializer_()).__func__(self)
+
+    def __repr__(self):
+        return self.to_json()
+
     def __copy__(self):
         """
         Supports shallow copy of DataObject. This gives user back plain old python dictionary.
@@ -160,21 +340,12 @@ class DataObject(RestrictedDictMixin):
     def schema(cls):
         """
         Schema of data object is its key structure based on restrictions. Nested data objects are also supported.
+        The schema is generated once per class, see `do_py.data_object.schema_registry`.
         Note: DynamicRestrictions are not supported
         :return: schema
         :rtype: dict
         """
-        if not cls._schema:
-            s = dict()
-            for k, v in cls._restrictions.items():
-                if type(v) is ABCRestrictionMeta:
-                    s[k] = v.schema
-                elif type(v) is tuple and type(v[0]) is ABCRestrictionMeta:
-                    s[k] = v[0].schema
-                else:
-                    s[k] = v.schema_value
-            cls._schema = s
-        return cls._schema
+        return schema_registry.get(cls, schema_registry.SCHEMA, build_schema)
 
     def __dir__(self):
         return super(DataObject, self).__dir__() + list(self._restrictions.keys())
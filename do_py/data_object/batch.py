@@ -0,0 +1,137 @@
+"""
+Batch construction of DataObjects.
+:date_created: 2026-10-17
+"""
+
+from functools import partial
+
+from ..abc.constants import ConstABCR
+from ..exceptions import DataObjectError
+
+
+class OnError:
+    """
+    Policies for handling invalid records in batch APIs.
+    :attribute RAISE: Abort on the first invalid record by raising its error.
+    :attribute SKIP: Drop invalid records.
+    :attribute COLLECT: Drop invalid records and append `(position, error)` to the `errors` list supplied by the caller.
+    """
+
+    RAISE = 'raise'
+    SKIP = 'skip'
+    COLLECT = 'collect'
+    allowed = [RAISE, SKIP, COLLECT]
+
+    @classmethod
+    def check(cls, on_error, errors):
+        """
+        Validate the policy arguments of a batch API.
+        :type on_error: str
+        :type errors: list or None
+        """
+        assert on_error in cls.allowed, 'Invalid "on_error"(=%s)' % on_error
+        assert on_error != cls.COLLECT or type(errors) is list, '"errors" list required to collect errors'
+
+
+def is_direct(cls):
+    """
+    Whether instances of `cls` can be built directly from validated data, i.e. `cls` is a leaf class that keeps
+    DataObject's `__init__` and allocates instances with the builtin `dict.__new__`. A `__new__` declared anywhere in
+    the hierarchy must run, so such classes are instantiated normally.
+    :type cls: ABCRestrictionMeta
+    :rtype: bool
+    """
+    from . import DataObject
+
+    return (
+        cls.__init__ is DataObject.__init__
+        and cls.__new__ is dict.__new__
+        and getattr(cls, ConstABCR.state, None) == ConstABCR.leaf
+    )
+
+
+def constructor(cls):
+    """
+    Resolve how an instance of `cls` is built directly from validated data, bypassing the metaclass `__new__` and the
+    instance `__init__` dispatch. Only valid for classes accepted by `is_direct`.
+    :param cls: DataObject class to build.
+    :type cls: ABCRestrictionMeta
+    :return: function building an instance from validated data, i.e. a mapping or an iterable of key-value pairs.
+    :rtype: types.FunctionType
+    """
+    new = dict.__new__
+    init = dict.__init__
+    setattr_ = object.__setattr__
+
+    def construct(validated):
+        instance = new(cls)
+        init(instance, validated)
+        setattr_(instance, '_strict', True)
+        return instance
+
+    return construct
+
+
+def builder(cls, strict=True, collect_errors=False):
+    """
+    Resolve, once per batch, how a record is turned into an instance of `cls`.
+
+    Classes that keep DataObject's `__init__` and `dict.__new__` are built directly from the validated data, bypassing
+    the instance `__init__` dispatch. Any other class is instantiated normally. See `is_direct`.
+    :param cls: DataObject class to build.
+    :type cls: ABCRestrictionMeta
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param collect_errors: See Error Collection comments in DataObject._validate_data.
+    :type collect_errors: bool
+    :return: function building an instance from a record
+    :rtype: types.FunctionType
+    """
+    if not is_direct(cls):
+        if collect_errors:
+            return lambda record: cls(data=record, strict=strict, collect_errors=True)
+        return lambda record: cls(data=record, strict=strict)
+
+    validate = cls._validate_data
+    if collect_errors:
+        validate = partial(validate, collect_errors=True)
+    restrictions = cls._restrictions
+    construct = constructor(cls)
+
+    def build(record):
+        return construct(validate(restrictions, record, strict=strict))
+
+    return build
+
+
+def iter_many(cls, iterable, strict=True, on_error=OnError.RAISE, errors=None, collect_errors=False):
+    """
+    Lazily build instances of `cls` from an iterable of records.
+    :param cls: DataObject class to build.
+    :type cls: ABCRestrictionMeta
+    :param iterable: records, typically dicts
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param on_error: See `OnError`.
+    :type on_error: str
+    :param errors: Receives `(index, DataObjectError)` for every invalid record when `on_error` is COLLECT.
+    :type errors: list
+    :param collect_errors: Report all failures of a record at once. See `builder`.
+    :type collect_errors: bool
+    :rtype: collections.abc.Iterator
+    """
+    OnError.check(on_error, errors)
+    build = builder(cls, strict=strict, collect_errors=collect_errors)
+    if on_error == OnError.RAISE:
+        for record in iterable:
+            yield build(record)
+        return
+
+    for i, record in enumerate(iterable):
+        try:
+            instance = build(record)
+        except DataObjectError as e:
+            if on_error == OnError.COLLECT:
+                errors.append((i, e))
+            continue
+        yield instance
@@ -0,0 +1,88 @@
+"""
+Error-collecting validation of DataObject data.
+
+`DataObject._validate_data` raises on the first failure. When errors are collected, data that failed validation is
+validated once more by `collect_errors`, which keeps going after a failure and records every failure, nested
+DataObjects and lists of DataObjects included, under the key path it occurred at.
+:date_created: 2026-10-17
+"""
+
+from collections.abc import Mapping
+
+from ..exceptions import DataObjectError, RestrictionError
+from .restriction import _MgdRestRestriction, _NullableDataObjectRestriction
+
+
+def _collect_nested(obj_cls, restriction, value, strict, path, errors):
+    """
+    Collect the errors of a nested DataObject value. The value is built by restriction when its data is valid so that
+    validations beyond restrictions, e.g. Validator._validate, run as well.
+    """
+    if type(value) is obj_cls:
+        return
+    elif isinstance(value, Mapping):
+        count = len(errors)
+        collect_errors(obj_cls, obj_cls._restrictions, value, strict=strict, path=path, errors=errors)
+        if len(errors) > count:
+            return
+    elif value is not None:
+        errors.append((path, RestrictionError.bad_data(value, obj_cls)))
+        return
+    try:
+        restriction(value, strict=strict)
+    except (RestrictionError, DataObjectError) as e:
+        errors.append((path, e))
+
+
+def collect_errors(cls, restrictions, d, strict=True, path=(), errors=None):
+    """
+    Validate data as per DataObject restrictions, collecting every failure rather than raising the first one.
+    :param cls: DataObject class the data is validated for.
+    :type cls: ABCRestrictionMeta
+    :param restrictions: DO restrictions
+    :type restrictions: dict
+    :param d: Data
+    :type d: dict
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param path: Key path of d within the data being validated.
+    :type path: tuple
+    :param errors: Errors are appended to this list.
+    :type errors: list
+    :return: `(path, error)` for every failure. The path is a tuple of keys, and list indexes for ManagedList items.
+    :rtype: list[tuple[tuple, Exception]]
+    """
+    # NOTE: do_py.common depends on this package, so it can only be imported once data is being validated.
+    from do_py.common.managed_list import ManagedList
+
+    errors = [] if errors is None else errors
+    d = {} if d is None else d
+    for k in d.keys():
+        if k not in restrictions:
+            errors.append((path + (k,), DataObjectError.from_unknown_key(k, cls)))
+
+    for k, restriction in restrictions.items():
+        key_path = path + (k,)
+        if k not in d:
+            if strict:
+                errors.append((key_path, DataObjectError.from_required_key(k, cls)))
+            continue
+
+        value = d[k]
+        if isinstance(restriction, _NullableDataObjectRestriction):
+            _collect_nested(restriction.allowed, restriction, value, strict, key_path, errors)
+        elif (
+            type(restriction) is _MgdRestRestriction
+            and isinstance(restriction.allowed, ManagedList)
+            and type(value) is list
+            and strict
+        ):
+            obj_cls = restriction.allowed.obj_cls
+            for i, item in enumerate(value):
+                _collect_nested(obj_cls, obj_cls, item, True, key_path + (i,), errors)
+        else:
+            try:
+                restriction(value, strict=strict)
+            except (RestrictionError, DataObjectError) as e:
+                errors.append((key_path, DataObjectError.from_restriction_error(k, cls, e)))
+    return errors
@@ -0,0 +1,182 @@
+"""
+Columnar validation of DataObject data.
+
+Data held column-wise, e.g. `{'id': [...], 'amount': [...], 'ts': [...]}`, is validated without transposing it to
+records: each restriction is applied once per column. Type restrictions check the set of types of the whole column,
+value restrictions the set of its values, and managed datetimes are parsed in one pass. Failures are reported as
+row-wise validation reports them: per row, the error of the first failing key in `_restrictions` order.
+:date_created: 2026-10-17
+"""
+
+from ..exceptions import DataObjectError, RestrictionError
+from .batch import OnError, constructor, is_direct, iter_many
+from .restriction import _ListNoRestriction, _ListTypeRestriction, _ListValueRestriction, _MgdRestRestriction
+
+
+def _wrap(k, cls, e):
+    """
+    :return: The DataObjectError row-wise validation raises for the RestrictionError e of key k.
+    :rtype: DataObjectError
+    """
+    error = DataObjectError.from_restriction_error(k, cls, e)
+    error.__cause__ = e
+    return error
+
+
+def _check_each(cls, k, restriction, values, strict, failed):
+    """
+    Validate a column value by value. Rows that already failed are not validated.
+    :return: Validated values
+    :rtype: list
+    """
+    validated = []
+    for i, value in enumerate(values):
+        if i not in failed:
+            try:
+                value = restriction(value, strict=strict)
+            except RestrictionError as e:
+                failed[i] = _wrap(k, cls, e)
+            except DataObjectError as e:
+                failed[i] = e
+        validated.append(value)
+    return validated
+
+
+def _check_column(cls, k, restriction, values, strict, failed):
+    """
+    Validate the column of key k. The error of each failing row is added to failed, unless the row already failed.
+    :param cls: DataObject class the columns are validated for.
+    :type cls: ABCRestrictionMeta
+    :type k: str
+    :type restriction: AbstractRestriction
+    :type values: list
+    :type strict: bool
+    :param failed: `{row: DataObjectError}` of the rows that failed so far.
+    :type failed: dict
+    :return: Validated values
+    :rtype: list
+    """
+    # NOTE: do_py.common depends on this package, so it can only be imported once data is being validated.
+    from do_py.common.managed_datetime import MgdDatetime
+
+    kind = type(restriction)
+    if kind is _ListNoRestriction:
+        return values
+    elif kind is _ListTypeRestriction:
+        allowed = restriction._allowed_set
+        if not allowed.issuperset(map(type, values)):
+            for i, value in enumerate(values):
+                if type(value) not in allowed and i not in failed:
+                    failed[i] = _wrap(k, cls, RestrictionError.bad_data(type(value), restriction._allowed))
+        return values
+    elif kind is _ListValueRestriction:
+        try:
+            if restriction._allowed_set.issuperset(values):
+                return values
+        except TypeError:
+            # NOTE: Unhashable values are compared against each allowed value.
+            pass
+    elif kind is _MgdRestRestriction and type(restriction.allowed) is MgdDatetime and strict:
+        errors = []
+        values = restriction.allowed.manage_many(values, errors=errors)
+        for i, e in errors:
+            failed.setdefault(i, _wrap(k, cls, e))
+        return values
+    return _check_each(cls, k, restriction, values, strict, failed)
+
+
+def check_columns(cls, columns, strict=True):
+    """
+    Validate columns against the restrictions of cls.
+    :param cls: DataObject class to validate the columns for.
+    :type cls: ABCRestrictionMeta
+    :param columns: A sequence of values per key. Every column has one value per row.
+    :type columns: dict
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :return: The validated columns in `_restrictions` order, and `{row: DataObjectError}` of the rows that failed.
+    :rtype: tuple[dict, dict]
+    """
+    lengths = {len(values) for values in columns.values()}
+    assert len(lengths) <= 1, 'Columns must have the same length, got %s' % sorted(lengths)
+    n = lengths.pop() if lengths else 0
+    restrictions = cls._restrictions
+
+    failed = {}
+    for k in columns:
+        if k not in restrictions:
+            for i in range(n):
+                failed[i] = DataObjectError.from_unknown_key(k, cls)
+            return {}, failed
+
+    validated = {}
+    for k, restriction in restrictions.items():
+        if k in columns:
+            validated[k] = _check_column(cls, k, restriction, list(columns[k]), strict, failed)
+        elif strict:
+            for i in range(n):
+                if i not in failed:
+                    failed[i] = DataObjectError.from_required_key(k, cls)
+            # NOTE: Every row failed; the column is kept so that no column is missing when there are no rows.
+            validated[k] = [None] * n
+        else:
+            # NOTE: Defaults may be mutable, i.e. nested DataObjects, so each row gets its own.
+            validated[k] = [restriction.default for _ in range(n)]
+    return validated, failed
+
+
+def validate_columns(cls, columns, strict=True, on_error=OnError.RAISE, errors=None, as_rows=False):
+    """
+    Validate data held column-wise. See the module docstring.
+
+    Classes that do not keep DataObject's `__init__`, e.g. Validators, must run their own initialization on each row.
+    Their rows are built one by one, as `iter_many` does.
+    :param cls: DataObject class to validate the columns for.
+    :type cls: ABCRestrictionMeta
+    :param columns: A sequence of values per key. Every column has one value per row.
+    :type columns: dict
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param on_error: See `OnError`. When raising, the error raised is the one of the first invalid row.
+    :type on_error: str
+    :param errors: Receives `(row, DataObjectError)` for every invalid row when `on_error` is COLLECT.
+    :type errors: list
+    :param as_rows: Return an iterator building an instance of cls per valid row, instead of the validated columns.
+    :type as_rows: bool
+    :return: The validated columns, with invalid rows dropped, or an iterator of instances.
+    :rtype: dict or collections.abc.Iterator
+    """
+    OnError.check(on_error, errors)
+    if not is_direct(cls):
+        keys = list(columns)
+        records = (dict(zip(keys, row, strict=True)) for row in zip(*columns.values(), strict=True))
+        instances = iter_many(cls, records, strict=strict, on_error=on_error, errors=errors)
+        if as_rows:
+            return instances
+        validated = {k: [] for k in cls._restrictions}
+        for instance in instances:
+            for k, values in validated.items():
+                values.append(instance[k])
+        return validated
+
+    validated, failed = check_columns(cls, columns, strict=strict)
+    if failed:
+        if on_error == OnError.RAISE:
+            raise failed[min(failed)]
+        elif on_error == OnError.COLLECT:
+            errors.extend(sorted(failed.items(), key=lambda item: item[0]))
+        validated = {k: [v for i, v in enumerate(values) if i not in failed] for k, values in validated.items()}
+    if as_rows:
+        return _iter_rows(cls, validated)
+    return validated
+
+
+def _iter_rows(cls, validated):
+    """
+    Build an instance of cls per row of validated columns.
+    :rtype: collections.abc.Iterator
+    """
+    construct = constructor(cls)
+    keys = list(validated)
+    for row in zip(*validated.values(), strict=True):
+        yield construct(zip(keys, row, strict=True))
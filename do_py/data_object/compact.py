@@ -0,0 +1,180 @@
+"""
+Slot-backed DataObjects for keeping many small records in memory.
+:date_created: 2026-10-17
+"""
+
+import copy
+from collections.abc import Mapping
+
+from do_py.abc import ABCRestrictionMeta, ABCRestrictions
+from do_py.data_object import DataObject
+
+
+class CompactRestrictionMeta(ABCRestrictionMeta):
+    """
+    ABCRestrictionMeta for CompactDataObject. Every class is declared with `__slots__` so that instances never carry
+    an instance `__dict__`.
+    """
+
+    def __new__(mcs, cls_name, parents, namespace):
+        namespace.setdefault('__slots__', ())
+        return super(CompactRestrictionMeta, mcs).__new__(mcs, cls_name, parents, namespace)
+
+
+@ABCRestrictions.require('_restrictions')
+class CompactDataObject(metaclass=CompactRestrictionMeta):
+    """
+    Opt-in compact storage for DataObjects. Declared exactly like a DataObject, but values are stored in a single list
+    ordered by the `_restrictions` keys rather than in a dict, and instances have no `__dict__`.
+
+    The read-only mapping API, attribute access and validation on write match DataObject. Instances are registered as
+    `collections.abc.Mapping`, but they are not `dict` instances. Since instances have no `__dict__`, attributes outside
+    the key namespace cannot be set on them (this includes `cached_property`).
+
+    Example:
+        class Point(CompactDataObject):
+            _restrictions = {
+                'x': R.INT,
+                'y': R.INT
+                }
+
+        p = Point({'x': 1, 'y': 2})
+        p.x  # 1
+        p['y'] = 3
+        dict(p)  # {'x': 1, 'y': 3}
+    """
+
+    __slots__ = ('_values', '_strict')
+    _is_abstract_ = True
+    _index_ = None
+
+    # NOTE: Restriction compilation, validation and batch construction are shared with DataObject.
+    _validator_ = None
+    _serializer_ = None
+    _compile_validator_ = DataObject.__dict__['_compile_validator_']
+    _compile_serializer_ = DataObject.__dict__['_compile_serializer_']
+    _validate_data = DataObject.__dict__['_validate_data']
+    iter_many = DataObject.__dict__['iter_many']
+    from_many = DataObject.__dict__['from_many']
+    iter_ndjson = DataObject.__dict__['iter_ndjson']
+    validate_columns = DataObject.__dict__['validate_columns']
+    schema = DataObject.__dict__['schema']
+    to_json = DataObject.__dict__['to_json']
+
+    @classmethod
+    def __compile__(cls):
+        """
+        See DataObject.__compile__. The position of each key in the value list is resolved here.
+        """
+        DataObject.__dict__['__compile__'].__func__(cls)
+        cls._index_ = {k: i for i, k in enumerate(cls._restrictions)}
+
+    def __init__(self, data=None, strict=True, collect_errors=False):
+        """
+        Initialize CompactDataObject.
+        :param data: Initialize to this dictionary.
+        :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+        :param collect_errors: See Error Collection comments in DataObject._validate_data.
+        """
+        self._strict = strict
+        # NOTE: Validated data is ordered per _restrictions.
+        data = self._validate_data(self._restrictions, data, strict=strict, collect_errors=collect_errors)
+        self._values = list(data.values())
+        self._strict = True
+
+    def __call__(self, data=None, strict=True):
+        """
+        This re-initializes the data object.
+        """
+        self.__init__(data=data, strict=strict)
+        return self
+
+    def __getitem__(self, item):
+        return self._values[self._index_[item]]
+
+    def __setitem__(self, item, value):
+        """
+        This assigns a value to item in the key namespace. This value will undergo data validation.
+        """
+        self._values[self._index_[item]] = self._restrictions[item](value)
+
+    def __getattr__(self, item):
+        """
+        Only called when item is not found in the attribute namespace, meaning that we only need to check
+        if item exists in the key space.
+        :raises AttributeError: Item is not a key.
+        """
+        index = type(self)._index_.get(item)
+        if index is None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, item))
+        return self._values[index]
+
+    def __setattr__(self, key, value):
+        """
+        Keys are assigned in the key namespace, anything else in the attribute namespace.
+        """
+        if key in self._index_:
+            self[key] = value
+        else:
+            super(CompactDataObject, self).__setattr__(key, value)
+
+    def __contains__(self, item):
+        return item in self._index_
+
+    def __iter__(self):
+        return iter(self._index_)
+
+    def __len__(self):
+        return len(self._index_)
+
+    def keys(self):
+        return self._index_.keys()
+
+    def values(self):
+        return list(self._values)
+
+    def items(self):
+        return list(zip(self._index_, self._values, strict=True))
+
+    def get(self, k, default=None):
+        index = self._index_.get(k)
+        return default if index is None else self._values[index]
+
+    def __eq__(self, other):
+        if isinstance(other, CompactDataObject):
+            other = other.__copy__()
+        return self.__copy__() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __copy__(self):
+        """
+        Supports shallow copy. This gives user back plain old python dictionary.
+        :rtype: dict
+        """
+        return dict(zip(self._index_, self._values, strict=True))
+
+    def __deepcopy__(self, memodict=None):
+        """
+        Supports deep copying. This gives user back plain old python dictionary.
+        :rtype: dict
+        """
+        return copy.deepcopy(self.__copy__(), memodict)
+
+    def __reduce__(self):
+        return self.__class__, (self.__copy__(),)
+
+    def __repr__(self):
+        return self.to_json()
+
+    def __str__(self):
+        return '%s%s' % (self.__class__.__name__, self.__copy__())
+
+    def __dir__(self):
+        return dir(type(self)) + list(self._index_)
+
+
+Mapping.register(CompactDataObject)
@@ -0,0 +1,146 @@
+"""
+Per-class validator compilation for DataObjects.
+
+DataObject._validate_data walks `_restrictions` generically for every instance. When a leaf class is compiled, the
+restrictions are known, so a validator specialized for that class is generated from source (the same way `dataclasses`
+generates `__init__`). Type checks, value checks and nested DataObject construction are inlined; any other restriction
+is called directly.
+:date_created: 2026-10-17
+"""
+
+from collections.abc import Mapping
+
+from ..exceptions import DataObjectError, RestrictionError
+from .code_cache import code_cache
+from .restriction import (
+    _DataObjectRestriction,
+    _ListNoRestriction,
+    _ListTypeRestriction,
+    _ListValueRestriction,
+    _NullableDataObjectRestriction,
+)
+
+_RAISE = (
+    '{i}_e = RestrictionError.bad_data({data}, {allowed})\n'
+    '{i}raise DataObjectError.from_restriction_error(_k{n}, cls, _e) from _e'
+)
+_GUARD = (
+    '{i}try:\n'
+    '{i}    {stmt}\n'
+    '{i}except RestrictionError as _e:\n'
+    '{i}    raise DataObjectError.from_restriction_error(_k{n}, cls, _e) from _e'
+)
+
+
+def _indent(level):
+    return '    ' * level
+
+
+def _check_lines(n, restriction, namespace):
+    """
+    Source lines validating `v` against restriction `n`. The lines assume they are nested two levels deep.
+    :type n: int
+    :type restriction: AbstractRestriction
+    :param namespace: Globals of the generated function; restriction specific references are added to it.
+    :type namespace: dict
+    :rtype: list[str]
+    """
+    i = _indent(2)
+    kind = type(restriction)
+    if kind is _ListNoRestriction:
+        return []
+    elif kind is _ListTypeRestriction:
+        namespace['_a%s' % n] = restriction._allowed_set
+        return [
+            '%sif type(v) not in _a%s:' % (i, n),
+            _RAISE.format(i=_indent(3), n=n, data='type(v)', allowed='_r%s._allowed' % n),
+        ]
+    elif kind is _ListValueRestriction:
+        namespace['_a%s' % n] = restriction._allowed_set
+        return [
+            '%stry:' % i,
+            '%s_ok = v in _a%s' % (_indent(3), n),
+            '%sexcept TypeError:' % i,
+            '%s_ok = v in _r%s._allowed' % (_indent(3), n),
+            '%sif not _ok:' % i,
+            _RAISE.format(i=_indent(3), n=n, data='v', allowed='_r%s._allowed' % n),
+        ]
+    elif kind is _DataObjectRestriction:
+        namespace['_c%s' % n] = restriction.allowed
+        return [
+            '%sif type(v) is not _c%s:' % (i, n),
+            _GUARD.format(i=_indent(3), n=n, stmt='v = _c%s(data=v, strict=strict)' % n),
+        ]
+    elif kind is _NullableDataObjectRestriction:
+        namespace['_c%s' % n] = restriction.allowed
+        return [
+            '%sif v is not None and type(v) is not _c%s:' % (i, n),
+            '%sif strict and not isinstance(v, Mapping):' % _indent(3),
+            _RAISE.format(i=_indent(4), n=n, data='v', allowed='_c%s' % n),
+            _GUARD.format(i=_indent(3), n=n, stmt='v = _c%s(data=v, strict=strict)' % n),
+        ]
+    else:
+        return [_GUARD.format(i=i, n=n, stmt='v = _r%s(v, strict=strict)' % n)]
+
+
+def validator_source(cls, restrictions):
+    """
+    Generate the source of the validator for `restrictions`, along with the globals it must be executed in.
+    :param cls: DataObject class the validator is generated for.
+    :type cls: ABCRestrictionMeta
+    :param restrictions: Compiled restrictions of `cls`, i.e. after `Restriction.legacy` conversion.
+    :type restrictions: dict
+    :rtype: tuple[str, dict]
+    """
+    namespace = {
+        'Mapping': Mapping,
+        'DataObjectError': DataObjectError,
+        'RestrictionError': RestrictionError,
+        # NOTE: Keys are checked against the restrictions the validator is generated for, even if the restrictions
+        # of cls are mutated in place later on. See `schema_registry.invalidate`.
+        '_keys': frozenset(restrictions),
+    }
+    lines = [
+        'def _validator_(cls, d, strict):',
+        '    if d is None:',
+        '        d = {}',
+        '    if not _keys.issuperset(d.keys()):',
+        '        for k in d.keys():',
+        '            if k not in _keys:',
+        '                raise DataObjectError.from_unknown_key(k, cls)',
+        '    _dict = {}',
+    ]
+    for n, (k, restriction) in enumerate(restrictions.items()):
+        namespace['_k%s' % n] = k
+        namespace['_r%s' % n] = restriction
+        lines.append('    if _k%s in d:' % n)
+        lines.append('        v = d[_k%s]' % n)
+        lines.extend(_check_lines(n, restriction, namespace))
+        lines.append('        _dict[_k%s] = v' % n)
+        lines.append('    elif strict:')
+        lines.append('        raise DataObjectError.from_required_key(_k%s, cls)' % n)
+        lines.append('    else:')
+        lines.append('        _dict[_k%s] = _r%s.default' % (n, n))
+    lines.append('    return _dict')
+    return '\n'.join(lines) + '\n', namespace
+
+
+def compile_validator(cls, restrictions):
+    """
+    Build the validator function for `restrictions`. It is equivalent to `DataObject._validate_data` for these
+    restrictions, including the order in which errors are raised.
+    :param cls: DataObject class the validator is compiled for.
+    :type cls: ABCRestrictionMeta
+    :param restrictions: Compiled restrictions of `cls`.
+    :type restrictions: dict
+    :return: function with signature (cls, d, strict) returning the validated dict. Its `_restrictions_` attribute
+        holds restrictions.
+    :rtype: types.FunctionType
+    """
+    source, namespace = validator_source(cls, restrictions)
+    code = code_cache.compile(source, '<do_py validator %s.%s>' % (cls.__module__, cls.__qualname__))
+    exec(code, namespace)
+    fn = namespace['_validator_']
+    fn.__qualname__ = '%s._validator_' % cls.__qualname__
+    fn._restrictions_ = restrictions
+    return fn
@@ -4,7 +4,7 @@ Dynamic restrictions for a DataObject.
 :author: Gian Brazzini
 """
 
-import copy
+from weakref import WeakKeyDictionary
 
 from do_py import DataObject, R
 from do_py.abc import ABCRestrictionMeta
@@ -46,6 +46,30 @@ class DynamicClassGenerator(DataObject):
         """
         return '_update_%s_restriction' % self.dependent_key
 
+    @cached_property
+    def resolved_restrictions(self):
+        """
+        Restrictions resolved per class and independent key value. Instances share these dicts rather than each
+        holding a copy of the class restrictions. The dicts are never mutated.
+        :rtype: WeakKeyDictionary
+        """
+        return WeakKeyDictionary()
+
+    def restrictions_for(self, cls, value):
+        """
+        Get the restrictions of `cls` where the dependent key is restricted per the independent key's `value`.
+        :param cls: Class inheriting the dynamic mixin.
+        :type cls: type(DataObject)
+        :param value: Value of the independent key.
+        :rtype: dict
+        """
+        by_value = self.resolved_restrictions.setdefault(cls, {})
+        if value not in by_value:
+            restrictions = dict(cls._restrictions)
+            restrictions[self.dependent_key] = self.dynamic_restrictions[value]
+            by_value[value] = restrictions
+        return by_value[value]
+
     @cached_property
     def dynamic_class(self):
         """
@@ -59,9 +83,10 @@ class DynamicClassGenerator(DataObject):
             Update the dynamic restriction. This function will live inside the instance of the
             class under the name declared in `update_fn_name`.
             """
-            restriction = self.dynamic_restrictions[instance_self[self.independent_key]]
-            # Update the restriction.
-            instance_self._restrictions[self.dependent_key] = restriction
+            # Point the instance to the restrictions resolved for the independent key's value.
+            instance_self._restrictions = self.restrictions_for(
+                type(instance_self), instance_self[self.independent_key]
+            )
             # Validate the data with the new restriction.
             instance_self._restrictions[self.dependent_key](instance_self[self.dependent_key])
             # Set the dynamic in the instance so that we can verify the data.
@@ -84,9 +109,8 @@ class DynamicClassGenerator(DataObject):
         """
 
         def __init__(instance_self, data, **init_kwargs):
-            # Each instance is required to have a copy of the restrictions, otherwise the restrictions are shared by
-            # reference.
-            instance_self._restrictions = copy.deepcopy(instance_self._restrictions)
+            # NOTE: The class restrictions are never mutated. Instances are pointed to restrictions resolved per
+            # independent key value by the update restriction method.
             super(self.dynamic_class, instance_self).__init__(data, **init_kwargs)
             getattr(instance_self, self.update_fn_name)()
 
@@ -0,0 +1,183 @@
+"""
+Opt-in instrumentation of DataObject validation.
+
+Whole-process profilers do not tell which DataObject classes and which of their keys dominate validation time. Once
+enabled, validation is timed and counted per class and key, and `ManagedRestrictions.manage` is timed per managed
+restriction class. When disabled, which is the default, the cost is one attribute lookup per DataObject initialization
+and per managed restriction call.
+:date_created: 2026-10-17
+"""
+
+import threading
+import time
+
+
+def _name(cls):
+    return '%s.%s' % (cls.__module__, cls.__qualname__)
+
+
+class _TimedRestriction:
+    """
+    Stands in for a restriction while data is validated, recording `[calls, failures, time]` of its key into keys.
+    """
+
+    __slots__ = ('restriction', 'key', 'keys')
+
+    def __init__(self, restriction, key, keys):
+        self.restriction = restriction
+        self.key = key
+        self.keys = keys
+
+    @property
+    def default(self):
+        return self.restriction.default
+
+    def __call__(self, value, strict=True):
+        start = time.perf_counter()
+        try:
+            value = self.restriction(value, strict=strict)
+        except Exception:
+            self.keys[self.key] = [1, 1, time.perf_counter() - start]
+            raise
+        self.keys[self.key] = [1, 0, time.perf_counter() - start]
+        return value
+
+
+class Instrumentation:
+    """
+    Recorder of validation counts and timings.
+
+    Example:
+        from do_py.data_object.instrumentation import instrumentation
+
+        instrumentation.enable()
+        ...
+        instrumentation.snapshot()
+        # {
+        #     'classes': {
+        #         'app.models.Order': {
+        #             'count': 1200, 'failures': 3, 'time': 0.0412,
+        #             'keys': {'lines': {'calls': 1200, 'failures': 2, 'time': 0.0351}, ...},
+        #         },
+        #     },
+        #     'managed': {'do_py.common.managed_datetime.MgdDatetime': {'calls': 1200, 'failures': 0, 'time': 0.0046}},
+        # }
+
+    Timings are cumulative and in seconds. The time of a key includes the validation of the DataObjects nested in
+    it, which are also recorded under their own class. Instrumented validation does not use compiled validators.
+
+    :attribute enabled: Whether validation is being recorded.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._classes = {}
+        self._managed = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """
+        Drop everything recorded so far.
+        """
+        with self._lock:
+            self._classes = {}
+            self._managed = {}
+
+    def _record_class(self, name, elapsed, failed, keys):
+        """
+        :param name: Name of the DataObject class. Records are kept by name so that classes can be garbage collected.
+        :type name: str
+        :param keys: `{key: [calls, failures, time]}` recorded during one validation.
+        :type keys: dict
+        """
+        with self._lock:
+            record = self._classes.get(name)
+            if record is None:
+                record = self._classes[name] = [0, 0, 0.0, {}]
+            record[0] += 1
+            record[1] += failed
+            record[2] += elapsed
+            for k, (calls, failures, spent) in keys.items():
+                key_record = record[3].get(k)
+                if key_record is None:
+                    key_record = record[3][k] = [0, 0, 0.0]
+                key_record[0] += calls
+                key_record[1] += failures
+                key_record[2] += spent
+
+    def validate(self, cls, validate, restrictions, d, strict):
+        """
+        Run `validate(cls, restrictions, d, strict)`, the generic implementation of `DataObject._validate_data`, with
+        each restriction timed, recording counts and timings.
+        :type validate: types.FunctionType
+        :rtype: dict
+        """
+        keys = {}
+        timed = {k: _TimedRestriction(v, k, keys) for k, v in restrictions.items()}
+        start = time.perf_counter()
+        try:
+            validated = validate(cls, timed, d, strict)
+        except Exception as e:
+            # NOTE: Unknown and missing keys fail before any restriction is called.
+            key = getattr(e, 'key', None)
+            if key is not None and key not in keys:
+                keys[key] = [0, 1, 0.0]
+            self._record_class(_name(cls), time.perf_counter() - start, 1, keys)
+            raise
+        self._record_class(_name(cls), time.perf_counter() - start, 0, keys)
+        return validated
+
+    def manage(self, frame):
+        """
+        Run `frame.manage()`, recording its duration under the class of the managed restriction.
+        :type frame: ManagedRestrictions
+        """
+        start = time.perf_counter()
+        failed = 1
+        try:
+            frame.manage()
+            failed = 0
+        finally:
+            elapsed = time.perf_counter() - start
+            name = _name(type(frame))
+            with self._lock:
+                record = self._managed.get(name)
+                if record is None:
+                    record = self._managed[name] = [0, 0, 0.0]
+                record[0] += 1
+                record[1] += failed
+                record[2] += elapsed
+
+    def snapshot(self):
+        """
+        :return: Copy of everything recorded so far. Classes are named by module and qualified name; classes sharing a
+            name are recorded together.
+        :rtype: dict
+        """
+        with self._lock:
+            classes = {
+                name: {
+                    'count': count,
+                    'failures': failures,
+                    'time': spent,
+                    'keys': {
+                        k: {'calls': calls, 'failures': key_failures, 'time': key_spent}
+                        for k, (calls, key_failures, key_spent) in keys.items()
+                    },
+                }
+                for name, (count, failures, spent, keys) in self._classes.items()
+            }
+            managed = {
+                name: {'calls': calls, 'failures': failures, 'time': spent}
+                for name, (calls, failures, spent) in self._managed.items()
+            }
+        return {'classes': classes, 'managed': managed}
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,228 @@
+"""
+DataObjects that materialize nested DataObjects on first access.
+:date_created: 2026-10-17
+"""
+
+from collections.abc import Mapping
+
+from do_py.abc.constants import ConstABCR
+from do_py.common.managed_list import ManagedList
+from do_py.data_object import DataObject
+from do_py.data_object.compiler import compile_validator
+from do_py.data_object.restriction import _MgdRestRestriction, _NullableDataObjectRestriction
+from do_py.data_object.schema_registry import schema_registry
+from do_py.exceptions import DataObjectError, RestrictionError
+
+
+class _LazyRestriction:
+    """
+    Stands in for a nested restriction while the data is validated on initialization. The nested value is only
+    checked shallowly and kept as is; the wrapped restriction is applied when the key is first accessed.
+    """
+
+    def __init__(self, restriction, shallow_check=True):
+        """
+        :param restriction: The nested restriction to defer.
+        :type restriction: _NullableDataObjectRestriction or _MgdRestRestriction
+        :param shallow_check: Check the container type of the value.
+        :type shallow_check: bool
+        """
+        self.restriction = restriction
+        self.shallow_check = shallow_check
+        if isinstance(restriction, _MgdRestRestriction):
+            self.nullable = restriction.allowed.nullable
+            self.container = list
+            # NOTE: A list is never known to be materialized already, so it is always managed on access.
+            self.materialized = None
+        else:
+            self.nullable = type(restriction) is _NullableDataObjectRestriction
+            self.container = Mapping
+            self.materialized = restriction.allowed
+
+    @property
+    def default(self):
+        return self.restriction.default
+
+    def __call__(self, data, strict=True):
+        if self.shallow_check and strict:
+            if data is None:
+                if not self.nullable:
+                    raise RestrictionError.bad_data(data, self.restriction.allowed)
+            elif not isinstance(data, self.container):
+                raise RestrictionError.bad_data(data, self.restriction.allowed)
+        return data
+
+    def is_pending(self, value, strict=True):
+        """
+        :return: True when value still has to go through the nested restriction.
+        :rtype: bool
+        """
+        if value is None:
+            # NOTE: In non-strict initialization, None may be the default of a missing key. Defaults are not validated.
+            return strict and not self.nullable
+        return type(value) is not self.materialized
+
+
+class LazyDataObject(DataObject):
+    """
+    Nested DataObjects, and lists of DataObjects managed by ManagedList, are not built on initialization. The nested
+    data is stored as given and turned into its DataObject class the first time the key is read through `__getitem__`,
+    `__getattr__`, `get`, `values` or `items`. Validation errors of nested data are raised at that point, as
+    DataObjectError, or all at once by `validate_all`. Converting or comparing the object, e.g. `dict(obj)`, `{**obj}`,
+    `obj == other` or serializing it, materializes every pending key first, so unvalidated data never leaks out.
+
+    Intended for deep payloads where only a few branches are read. Set `_shallow_check = False` to skip the container
+    type check of nested values on initialization as well.
+
+    Example:
+        class Order(LazyDataObject):
+            _restrictions = {
+                'id': R.INT,
+                'customer': Customer,
+                'lines': ManagedList(OrderLine)
+                }
+
+        order = Order(payload)  # 'customer' and 'lines' are not validated yet
+        order.customer  # Customer instance, validated now
+        order.validate_all()  # Validates 'lines' as well
+
+    :attribute _shallow_check: Check that nested values are mappings (lists for ManagedList) on initialization.
+    """
+
+    _is_abstract_ = True
+    _shallow_check = True
+    _lazy_restrictions_ = None
+    # NOTE: Read-only fallback until __init__ assigns the instance's pending keys.
+    _pending = {}
+
+    @classmethod
+    def __compile__(cls):
+        """
+        See DataObject.__compile__. The nested restrictions to defer are resolved here.
+        """
+        super(LazyDataObject, cls).__compile__()
+        lazy = {}
+        for k, v in cls._restrictions.items():
+            if isinstance(v, _NullableDataObjectRestriction) or (
+                type(v) is _MgdRestRestriction and isinstance(v.allowed, ManagedList)
+            ):
+                lazy[k] = _LazyRestriction(v, shallow_check=cls._shallow_check)
+        cls._lazy_restrictions_ = lazy
+
+    @classmethod
+    def _compile_validator_(cls):
+        """
+        See DataObject._compile_validator_. The validator is compiled with the nested restrictions deferred.
+        """
+        if getattr(cls, ConstABCR.state, None) != ConstABCR.leaf:
+            return None
+        return schema_registry.compiled(
+            cls, schema_registry.VALIDATOR, lambda c: compile_validator(c, {**c._restrictions, **c._lazy_restrictions_})
+        )
+
+    def __init__(self, data=None, strict=True, collect_errors=False):
+        """
+        Initialize LazyDataObject.
+        :param data: Initialize to this dictionary.
+        :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+        :param collect_errors: See Error Collection comments in DataObject._validate_data. Only failures found on
+            initialization are collected; nested data is validated in full only once initialization failed.
+        """
+        super(LazyDataObject, self).__init__(data=data, strict=strict, collect_errors=collect_errors)
+        # NOTE: Maps each key pending materialization to the strictness of the initialization it came from.
+        self._pending = {}
+        if self._restrictions is type(self)._restrictions:
+            for k, v in self._lazy_restrictions_.items():
+                if v.is_pending(dict.__getitem__(self, k), strict=strict):
+                    self._pending[k] = strict
+
+    def _materialize(self, item):
+        """
+        Apply the nested restriction to the value stored for item.
+        :raises DataObjectError: The nested value is invalid.
+        """
+        strict = self._pending[item]
+        try:
+            value = self._restrictions[item](dict.__getitem__(self, item), strict=strict)
+        except RestrictionError as e:
+            raise DataObjectError.from_restriction_error(item, type(self), e) from e
+        dict.__setitem__(self, item, value)
+        del self._pending[item]
+        return value
+
+    def __getitem__(self, item):
+        if item in self._pending:
+            return self._materialize(item)
+        return super(LazyDataObject, self).__getitem__(item)
+
+    def __setitem__(self, item, value):
+        super(LazyDataObject, self).__setitem__(item, value)
+        self._pending.pop(item, None)
+
+    def get(self, k, default=None):
+        return self[k] if k in self else default
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+    def _materialize_pending(self):
+        """
+        Materialize every pending key of this object.
+        :raises DataObjectError: A nested value is invalid.
+        """
+        for k in list(self._pending):
+            self._materialize(k)
+
+    def __iter__(self):
+        # NOTE: A dict subclass overriding __iter__ is not copied from its raw storage by dict(obj) or {**obj}; its
+        # values are read through keys() and __getitem__, which materializes pending keys.
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        # NOTE: dict comparison reads the raw storage of both sides.
+        self._materialize_pending()
+        if isinstance(other, LazyDataObject):
+            other._materialize_pending()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    __hash__ = None
+
+    def validate_all(self):
+        """
+        Materialize every pending key, in this object and in the nested LazyDataObjects.
+        :return: self
+        :raises DataObjectError: A nested value is invalid.
+        """
+        self._materialize_pending()
+        for v in dict.values(self):
+            if isinstance(v, LazyDataObject):
+                v.validate_all()
+            elif isinstance(v, list):
+                # NOTE: OrderedManagedList values are SortedLists.
+                for e in v:
+                    if isinstance(e, LazyDataObject):
+                        e.validate_all()
+        return self
+
+    def __copy__(self):
+        """
+        See DataObject.__copy__. Pending keys are materialized first.
+        :rtype: dict
+        """
+        return dict(self.items())
+
+    def __repr__(self):
+        """
+        Serializing forces validation of all nested data. See `validate_all`.
+        """
+        return super(LazyDataObject, self.validate_all()).__repr__()
+
+    def __str__(self):
+        return super(LazyDataObject, self.validate_all()).__str__()
@@ -5,11 +5,14 @@ Data Object Restrictions.
 
 import copy
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections.abc import Mapping
 from datetime import date, datetime
 
 from ..abc import ABCRestrictionMeta
 from ..exceptions import RestrictionError
-from ..utils import classproperty
+from .instrumentation import instrumentation
+from .restriction_cache import RestrictionCache
+from .schema_registry import build_es_mapping, schema_registry
 
 
 class AbstractRestriction(tuple):
@@ -125,10 +128,10 @@ def is_immutable(obj):
 class SingletonRestriction(AbstractRestriction):
     """
     This is an interface for Restriction type to use singleton structure. The objective is to use pre-defined
-    restrictions and reduce the memory footprint of DataObject declarations.
+    restrictions and reduce the memory footprint of DataObject declarations. See `RestrictionCache`.
     """
 
-    _cache = {}
+    _cache = RestrictionCache()
 
     def __new__(cls, restriction_tuple):
         """
@@ -149,18 +152,17 @@ class SingletonRestriction(AbstractRestriction):
                 rt1 = frozenset(restriction_tuple[1])
 
             # cls.__name__ supports restriction inheritance, i.e. _NullableDataObjectRestriction
-            if type(restriction_tuple[0]) is ABCRestrictionMeta:
+            if isinstance(restriction_tuple[0], ABCRestrictionMeta):
                 hashable = (cls.__name__, restriction_tuple[0])
             else:
                 hashable = (cls.__name__, frozenset(restriction_tuple[0]), rt1)
         except TypeError as e:
             raise RestrictionError.from_unhashable(restriction_tuple[0], restriction_tuple[1]) from e
 
-        if hashable in cls._cache:
-            return cls._cache[hashable]
-        else:
-            cls._cache[hashable] = super(SingletonRestriction, cls).__new__(cls, restriction_tuple)
-            return cls._cache[hashable]
+        restriction = cls._cache.get(hashable)
+        if restriction is None:
+            restriction = cls._cache.put(hashable, super(SingletonRestriction, cls).__new__(cls, restriction_tuple))
+        return restriction
 
     @property
     def schema_value(self):
@@ -176,6 +178,9 @@ class SingletonRestriction(AbstractRestriction):
         raise NotImplementedError('ES restrictions not defined.')
 
 
+restriction_cache = SingletonRestriction._cache
+
+
 class _ListTypeRestriction(SingletonRestriction):
     """
     Manage restriction of syntax ([type], None)
@@ -203,19 +208,23 @@ class _ListTypeRestriction(SingletonRestriction):
     Good for some data like pulsechecks sent (x >= 0).
     """
 
+    # NOTE: Hashed copy of allowed, so that type checks are constant time.
+    _allowed_set = None
+
     def __new__(cls, allowed, default=None, **kwargs):
         return super(_ListTypeRestriction, cls).__new__(cls, (allowed, default))
 
     def __init__(self, *args, **kwargs):
         super(_ListTypeRestriction, self).__init__()
-        if len([e for e in self._allowed if type(e) is ABCRestrictionMeta]) != 0:
+        if len([e for e in self._allowed if isinstance(e, ABCRestrictionMeta)]) != 0:
             raise RestrictionError.from_dataobj_in_rstr_list(self._allowed)
 
         if not all([isinstance(r, type) for r in self._allowed]):
             raise RestrictionError.from_mixed_value_and_type(self._allowed)
+        self._allowed_set = frozenset(self._allowed)
 
     def __call__(self, data, **kwargs):
-        if type(data) not in self._allowed:
+        if type(data) not in self._allowed_set:
             raise RestrictionError.bad_data(type(data), self._allowed)
         return data
 
@@ -267,11 +276,24 @@ class _ListValueRestriction(SingletonRestriction):
     Good choice for some data such as Review ratings (1 <= ratings <= 5).
     """
 
+    # NOTE: Hashed copy of allowed, so that value checks are constant time. Values are always hashable, as required by
+    # SingletonRestriction.
+    _allowed_set = None
+
     def __new__(cls, allowed, default=None, **kwargs):
         return super(_ListValueRestriction, cls).__new__(cls, (allowed, default))
 
+    def __init__(self, *args, **kwargs):
+        super(_ListValueRestriction, self).__init__()
+        self._allowed_set = frozenset(self._allowed)
+
     def __call__(self, data, **kwargs):
-        if data not in self._allowed:
+        try:
+            is_allowed = data in self._allowed_set
+        except TypeError:
+            # NOTE: Unhashable data, e.g. a list, is compared against each allowed value.
+            is_allowed = data in self._allowed
+        if not is_allowed:
             raise RestrictionError.bad_data(data, self._allowed)
         return data
 
@@ -389,7 +411,10 @@ class _MgdRestRestriction(AbstractRestriction):
 
     @property
     def es_restrictions(self):
-        # NOTE: _allowed is of ManagedRestrictions type. _restriction is of AbstractRestriction type
+        # NOTE: _allowed is of ManagedRestrictions type. _restriction is of AbstractRestriction type, unless the managed
+        # restriction maps itself.
+        if hasattr(self._allowed, 'es_restrictions'):
+            return self._allowed.es_restrictions
         return self._allowed._restriction.es_restrictions
 
 
@@ -429,9 +454,10 @@ class _NullableDataObjectRestriction(SingletonRestriction):
         return super(_NullableDataObjectRestriction, cls).__new__(cls, (allowed, default))
 
     def __call__(self, data, strict=True, **kwargs):
-        if data is None:
+        # NOTE: Instances of the DO are already validated.
+        if data is None or type(data) is self._allowed:
             return data
-        elif strict and not isinstance(data, dict):
+        elif strict and not isinstance(data, Mapping):
             raise RestrictionError.bad_data(data, self._allowed)
         return self._allowed(data=data, strict=strict)
 
@@ -448,10 +474,14 @@ class _NullableDataObjectRestriction(SingletonRestriction):
 
     @property
     def es_restrictions(self):
+        """
+        ES mapping of the DO: its own es_restrictions when declared, or the mapping generated from its restrictions.
+        Generated mappings are memoized per DO, see `SchemaRegistry`.
+        :rtype: dict
+        """
         if hasattr(self.dataobj, 'es_restrictions'):
             return self.dataobj.es_restrictions
-        else:
-            return {'properties': {k: v.es_restrictions for k, v in self.dataobj._restrictions.items()}}
+        return schema_registry.get(self.dataobj, schema_registry.ES_RESTRICTIONS, build_es_mapping)
 
 
 class _DataObjectRestriction(_NullableDataObjectRestriction):
@@ -465,7 +495,9 @@ class _DataObjectRestriction(_NullableDataObjectRestriction):
     allowed is a class reference to a DO.
 
     default:
-    None by default.
+    A new instance of the DO, initialized non-strict, every time the default is used. It is built on demand rather
+    than when the restriction is declared, so declaring deeply nested DOs does not build a tree of defaults, and
+    instances initialized non-strict never share a mutable default.
 
     Validation:
     Validation is performed by the DataObject.
@@ -487,8 +519,11 @@ class _DataObjectRestriction(_NullableDataObjectRestriction):
     """
 
     def __new__(cls, allowed, default=None, **kwargs):
-        default = allowed(strict=False)
-        return super(_DataObjectRestriction, cls).__new__(cls, allowed, default=default)
+        return super(_DataObjectRestriction, cls).__new__(cls, allowed)
+
+    @property
+    def default(self):
+        return self._allowed(strict=False)
 
     def __call__(self, data, strict=True, **kwargs):
         if type(data) is self._allowed:
@@ -514,7 +549,7 @@ class Restriction:
         elif type(allowed) is list:
             if len(allowed) == 0:
                 return _ListNoRestriction(allowed, default=default, **kwargs)
-            elif len(allowed) == 2 and ABCRestrictionMeta in [type(e) for e in allowed]:
+            elif len(allowed) == 2 and any([isinstance(e, ABCRestrictionMeta) for e in allowed]):
                 if type(None) not in allowed:
                     raise RestrictionError.from_unsupported_dataobj_in_rstr_list(allowed)
                 return _NullableDataObjectRestriction(allowed[1 - allowed.index(type(None))], default=default, **kwargs)
@@ -522,7 +557,7 @@ class Restriction:
                 return _ListTypeRestriction(allowed, default=default, **kwargs)
             else:
                 return _ListValueRestriction(allowed, default=default, **kwargs)
-        elif type(allowed) is ABCRestrictionMeta:
+        elif isinstance(allowed, ABCRestrictionMeta):
             return _DataObjectRestriction(allowed, default=default, **kwargs)
         else:
             raise RestrictionError.from_unsupported(allowed)
@@ -649,24 +684,35 @@ class ManagedRestrictions(metaclass=ABCMeta):
         """
         return self._restriction.schema_value
 
+    def _frame(self, value):
+        """
+        Create the per-call context `manage` runs against. The frame is a shallow copy of this restriction holding
+        `value` in its data attribute. Restriction instances are shared by every DataObject declaring them, so
+        managing data on a frame keeps them free of per-call state.
+        :param value: Data value that needs to be managed
+        :rtype: ManagedRestrictions
+        """
+        frame = object.__new__(type(self))
+        frame.__dict__.update(self.__dict__)
+        frame.data = value
+        return frame
+
     def __call__(self, value, strict=True):
         """
         Entry point for data management. DataObject will trigger a call to __call__ when it encounters a managed
-        restriction.
+        restriction. Data is managed on a frame, see `_frame`, so concurrent calls do not interfere.
         :param value: Data value that needs to be managed
         :param strict: Validation strictness.
         :return: Standardized data
         """
-        data_copy = copy.deepcopy(self.data)
-        try:
-            self.data = value
-            if strict:
-                self.manage()
-        except Exception:
-            self.data = data_copy
-            raise
-
-        return self.data
+        if not strict:
+            return value
+        frame = self._frame(value)
+        if instrumentation.enabled:
+            instrumentation.manage(frame)
+        else:
+            frame.manage()
+        return frame.data
 
     def __eq__(self, other):
         return self._restriction == other._restriction
@@ -714,21 +760,16 @@ class ESEncoder:
     Ref: https://www.elastic.co/guide/en/elasticsearch/reference/current/mapping-types.html
     """
 
-    @classproperty
-    def encoding(cls):
-        """
-        :rtype: dict
-        """
-        return {
-            int: ESR.INT,
-            float: ESR.FLOAT,
-            datetime: ESR.DATE,
-            date: ESR.DATE,
-            bool: ESR.BOOL,
-            str: ESR.STR,
-            'keyword': ESR.KEYWORD,
-            # list: {},
-        }
+    encoding = {
+        int: ESR.INT,
+        float: ESR.FLOAT,
+        datetime: ESR.DATE,
+        date: ESR.DATE,
+        bool: ESR.BOOL,
+        str: ESR.STR,
+        'keyword': ESR.KEYWORD,
+        # list: {},
+    }
 
     @classmethod
     def default(cls, obj):
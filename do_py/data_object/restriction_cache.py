@@ -0,0 +1,132 @@
+"""
+Bounded cache of singleton restrictions.
+:date_created: 2026-10-17
+"""
+
+import threading
+from collections import OrderedDict
+from weakref import WeakSet
+
+
+class RestrictionCache:
+    """
+    LRU cache backing `SingletonRestriction`, so that equal restrictions share one instance.
+
+    Restrictions are built at runtime too, e.g. `R(*values_from_db)`, so the cache is bounded. Once it holds more than
+    `maxsize` restrictions, the least recently used ones that no live DataObject class references are evicted. A
+    restriction referenced by a class is never evicted; DataObject classes register as owners of their restrictions
+    when they are compiled. Evicting a restriction only means the next equal restriction is a new instance.
+
+    Example:
+        from do_py.data_object.restriction import restriction_cache
+
+        restriction_cache.maxsize = 10000
+        restriction_cache.stats()  # {'hits': 1520, 'misses': 73, 'size': 73, 'evictions': 0, 'maxsize': 10000}
+
+    :attribute maxsize: Number of restrictions kept before evicting. None disables eviction.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        :type maxsize: int or None
+        """
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._owners = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        :param key: Hashable form of the restriction.
+        :return: The cached restriction, or None.
+        """
+        with self._lock:
+            restriction = self._entries.get(key)
+            if restriction is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return restriction
+
+    def put(self, key, restriction):
+        """
+        Cache restriction under key, then evict down to maxsize.
+        :param key: Hashable form of the restriction.
+        :type restriction: SingletonRestriction
+        :return: The restriction cached under key; an equal restriction cached concurrently wins.
+        """
+        with self._lock:
+            restriction = self._entries.setdefault(key, restriction)
+            # NOTE: Hashable form is kept on the restriction to register owners without recomputing it.
+            restriction._cache_key_ = key
+            self._evict()
+            return restriction
+
+    def add_owner(self, restriction, owner):
+        """
+        Mark restriction as referenced by owner, so it is not evicted while owner is alive.
+        :type restriction: SingletonRestriction
+        :param owner: DataObject class referencing restriction.
+        :type owner: ABCRestrictionMeta
+        """
+        key = getattr(restriction, '_cache_key_', None)
+        if key is None:
+            return
+        with self._lock:
+            # NOTE: A restriction evicted before its owner registered is cached again.
+            if self._entries.setdefault(key, restriction) is restriction:
+                self._owners.setdefault(key, WeakSet()).add(owner)
+
+    def _evict(self):
+        if self._maxsize is None or len(self._entries) <= self._maxsize:
+            return
+        for key in list(self._entries):
+            if len(self._entries) <= self._maxsize:
+                break
+            if self._owners.get(key):
+                continue
+            del self._entries[key]
+            self._owners.pop(key, None)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drop every cached restriction and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._owners.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        :return: Counters to monitor the cache by.
+        :rtype: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'evictions': self.evictions,
+            'maxsize': self._maxsize,
+        }
@@ -0,0 +1,129 @@
+"""
+Per-class memoization of the documents generated from DataObject restrictions.
+:date_created: 2026-10-17
+"""
+
+import threading
+from weakref import WeakSet
+
+from ..abc import ABCRestrictionMeta
+
+
+def build_schema(cls):
+    """
+    :return: Key structure of cls, see `DataObject.schema`.
+    :rtype: dict
+    """
+    s = dict()
+    for k, v in cls._restrictions.items():
+        if isinstance(v, ABCRestrictionMeta):
+            s[k] = v.schema
+        elif type(v) is tuple and isinstance(v[0], ABCRestrictionMeta):
+            s[k] = v[0].schema
+        else:
+            s[k] = v.schema_value
+    return s
+
+
+def build_es_mapping(cls):
+    """
+    :return: ES mapping of cls generated from its restrictions.
+    :rtype: dict
+    """
+    return {'properties': {k: v.es_restrictions for k, v in cls._restrictions.items()}}
+
+
+class SchemaRegistry:
+    """
+    Memoizes what is generated from the restrictions of a class, i.e. its `schema`, its ES mapping and its compiled
+    validator and serializer, once per class.
+
+    Documents are stored in the namespace of the class itself, along with the class they were generated for, so a
+    subclass never uses a document inherited from its parent. Compiled functions are stored as staticmethods of the
+    class, and are looked up in its namespace directly. Redeclaring a class creates a new class, hence new entries;
+    the entries of a class go away with the class, and are dropped when the class is compiled again.
+
+    Memoized documents are shared by every caller, so they must not be mutated.
+
+    Example:
+        from do_py.data_object.schema_registry import schema_registry
+
+        schema_registry.invalidate(Account)  # After mutating Account._restrictions in place.
+    """
+
+    # NOTE: Kinds of documents and functions are the attributes holding them in the class namespace.
+    SCHEMA = '_schema_'
+    ES_RESTRICTIONS = '_es_restrictions_'
+    VALIDATOR = '_validator_'
+    SERIALIZER = '_serializer_'
+    kinds = (SCHEMA, ES_RESTRICTIONS, VALIDATOR, SERIALIZER)
+
+    def __init__(self):
+        self._classes = WeakSet()
+        self._lock = threading.Lock()
+
+    def get(self, cls, kind, build):
+        """
+        :param cls: Class the document is generated for.
+        :type cls: ABCRestrictionMeta
+        :param kind: Kind of document, i.e. SCHEMA or ES_RESTRICTIONS.
+        :type kind: str
+        :param build: Generates the document for cls when it is not memoized yet.
+        :type build: types.FunctionType
+        :return: The memoized document.
+        """
+        entry = getattr(cls, kind, None)
+        if entry is not None and entry[0] is cls:
+            return entry[1]
+        # NOTE: Documents of nested classes are built, and memoized, while building the document of cls.
+        document = build(cls)
+        with self._lock:
+            if kind not in cls.__dict__:
+                type.__setattr__(cls, kind, (cls, document))
+                self._classes.add(cls)
+            return cls.__dict__[kind][1]
+
+    def compiled(self, cls, kind, build):
+        """
+        :param cls: Class the function is compiled for.
+        :type cls: ABCRestrictionMeta
+        :param kind: Kind of function, i.e. VALIDATOR or SERIALIZER.
+        :type kind: str
+        :param build: Compiles the function for cls when it is not memoized yet.
+        :type build: types.FunctionType
+        :return: The memoized function, as a staticmethod.
+        :rtype: staticmethod
+        """
+        fn = cls.__dict__.get(kind)
+        if fn is not None:
+            return fn
+        # NOTE: Functions of nested classes may be compiled while compiling the function of cls.
+        fn = staticmethod(build(cls))
+        with self._lock:
+            if cls.__dict__.get(kind) is None:
+                type.__setattr__(cls, kind, fn)
+                self._classes.add(cls)
+            return cls.__dict__[kind]
+
+    def invalidate(self, cls=None):
+        """
+        Drop the memoized documents and functions of cls, or of every class when cls is None. They are generated again
+        on next use. Documents of classes nesting cls are kept; invalidate them as well if they are to be regenerated.
+        :type cls: ABCRestrictionMeta or None
+        """
+        with self._lock:
+            classes = list(self._classes) if cls is None else [cls]
+            for c in classes:
+                for kind in self.kinds:
+                    if kind in c.__dict__:
+                        type.__delattr__(c, kind)
+                self._classes.discard(c)
+
+    def __contains__(self, cls):
+        return any(kind in cls.__dict__ for kind in self.kinds)
+
+    def __len__(self):
+        return len(self._classes)
+
+
+schema_registry = SchemaRegistry()
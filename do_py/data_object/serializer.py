@@ -0,0 +1,209 @@
+"""
+Per-class JSON serialization for DataObjects.
+
+`json.dumps(obj, cls=MyJSONEncoder)` calls the pure-Python `MyJSONEncoder.default` for every date and datetime, and
+cannot use what `_restrictions` tells about each key. The first time a leaf class is serialized, a serializer
+specialized for that class is generated from source, the same way as its validator (see `do_py.data_object.compiler`).
+The encoder of each key is picked up front; nested DataObjects and ManagedLists are serialized by the nested class's
+serializer.
+The output is identical to `json.dumps(obj, cls=MyJSONEncoder)` with its default arguments.
+:date_created: 2026-10-17
+"""
+
+import json
+from array import array
+from datetime import date, datetime
+from json.encoder import encode_basestring_ascii
+
+from do_py.utils.json_encoder import MyJSONEncoder
+
+from .code_cache import code_cache
+from .restriction import _ListTypeRestriction, _MgdRestRestriction, _NullableDataObjectRestriction
+
+_INFINITY = float('inf')
+_SPECIALIZED = '(_f{n}(v{n}) if type(v{n}) is _t{n} else encode(v{n}))'
+
+
+def _encode_float(v):
+    """
+    Same as the float representation of json.encoder with allow_nan=True.
+    """
+    if v != v:
+        return 'NaN'
+    elif v == _INFINITY:
+        return 'Infinity'
+    elif v == -_INFINITY:
+        return '-Infinity'
+    return float.__repr__(v)
+
+
+def _encode_list(v):
+    return '[%s]' % ', '.join([encode(e) for e in v])
+
+
+def _encode_array(v):
+    if v.typecode in 'fd':
+        return '[%s]' % ', '.join(map(_encode_float, v))
+    elif v.typecode == 'u':
+        return _encode_list(v)
+    return '[%s]' % ', '.join(map(int.__repr__, v))
+
+
+def _encode_dict(v):
+    for k in v:
+        if type(k) is not str:
+            return _fallback(v)
+    return '{%s}' % ', '.join([encode_basestring_ascii(k) + ': ' + encode(e) for k, e in v.items()])
+
+
+def _encode_isoformat(v):
+    return encode_basestring_ascii(v.isoformat())
+
+
+# NOTE: Keyed on the exact type. Subclasses of these types go through `_fallback`, as json may treat them differently.
+_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda v: 'true' if v else 'false',
+    type(None): lambda v: 'null',
+    list: _encode_list,
+    tuple: _encode_list,
+    array: _encode_array,
+    dict: _encode_dict,
+    datetime: _encode_isoformat,
+    date: _encode_isoformat,
+}
+
+
+def _fallback(v):
+    return json.dumps(v, cls=MyJSONEncoder)
+
+
+def _compiled(cls):
+    """
+    The serializer of cls, compiled on first use. See `DataObject._compile_serializer_`.
+    :type cls: type
+    :return: function with signature (obj), or None when cls has no serializer.
+    :rtype: types.FunctionType or None
+    """
+    serializer = cls.__dict__.get('_serializer_')
+    if serializer is None:
+        compile_serializer_ = getattr(cls, '_compile_serializer_', None)
+        if compile_serializer_ is None:
+            return None
+        serializer = compile_serializer_()
+    return None if serializer is None else serializer.__func__
+
+
+def encode(v):
+    """
+    Encode any value the way `json.dumps(v, cls=MyJSONEncoder)` does.
+    :rtype: str
+    """
+    fn = _ENCODERS.get(type(v))
+    if fn is not None:
+        return fn(v)
+    serializer = _compiled(type(v))
+    if serializer is not None:
+        return serializer(v)
+    return _fallback(v)
+
+
+def _managed_list_encoder(obj_cls):
+    """
+    :param obj_cls: DataObject class of the ManagedList items.
+    :rtype: types.FunctionType
+    """
+    serializer = _compiled(obj_cls)
+    if serializer is None:
+        return _encode_list
+
+    def encode_managed_list(v):
+        return '[%s]' % ', '.join([serializer(e) if type(e) is obj_cls else encode(e) for e in v])
+
+    return encode_managed_list
+
+
+def _specialize(restriction):
+    """
+    Pick the encoder for the values of a key, along with the exact type of value it applies to. Values of any other
+    type are passed to `encode`.
+    :type restriction: AbstractRestriction
+    :return: (encoder, type) or None when there is nothing to specialize on.
+    :rtype: tuple or None
+    """
+    # NOTE: do_py.common depends on this package, so it can only be imported once classes are being compiled.
+    from do_py.common.managed_datetime import MgdDatetime
+    from do_py.common.managed_list import ManagedList
+
+    kind = type(restriction)
+    if kind is _ListTypeRestriction:
+        types = [t for t in restriction.allowed if t is not type(None)]
+        if len(types) == 1 and types[0] in _ENCODERS:
+            return _ENCODERS[types[0]], types[0]
+    elif isinstance(restriction, _NullableDataObjectRestriction):
+        serializer = _compiled(restriction.allowed)
+        if serializer is not None:
+            return serializer, restriction.allowed
+    elif kind is _MgdRestRestriction:
+        managed = restriction.allowed
+        if isinstance(managed, ManagedList):
+            return _managed_list_encoder(managed.obj_cls), managed.container
+        elif isinstance(managed, MgdDatetime):
+            return _encode_isoformat, managed.dt_obj
+    return None
+
+
+def serializer_source(cls, restrictions):
+    """
+    Generate the source of the serializer for `restrictions`, along with the globals it must be executed in.
+    :param cls: DataObject class the serializer is generated for.
+    :type cls: ABCRestrictionMeta
+    :param restrictions: Compiled restrictions of `cls`.
+    :type restrictions: dict
+    :rtype: tuple[str, dict]
+    """
+    namespace = {'encode': encode}
+    if not restrictions:
+        return "def _serializer_(obj):\n    return '{}'\n", namespace
+
+    names = []
+    parts = []
+    for n, (k, restriction) in enumerate(restrictions.items()):
+        # NOTE: The key and its separators are encoded once, e.g. ', "id": '.
+        namespace['_p%s' % n] = (', ' if n else '{') + json.dumps({k: None})[1 : -len('null}')]
+        names.append('v%s' % n)
+        parts.append('_p%s' % n)
+        specialized = _specialize(restriction)
+        if specialized is None:
+            parts.append('encode(v%s)' % n)
+        else:
+            namespace['_f%s' % n], namespace['_t%s' % n] = specialized
+            parts.append(_SPECIALIZED.format(n=n))
+    parts.append("'}'")
+    lines = [
+        'def _serializer_(obj):',
+        # NOTE: Values are stored in the order of _restrictions.
+        '    %s = obj.values()' % (', '.join(names) if len(names) > 1 else 'v0,'),
+        "    return ''.join([%s])" % ', '.join(parts),
+    ]
+    return '\n'.join(lines) + '\n', namespace
+
+
+def compile_serializer(cls, restrictions):
+    """
+    Build the serializer of `cls`.
+    :param cls: DataObject class the serializer is compiled for.
+    :type cls: ABCRestrictionMeta
+    :param restrictions: Compiled restrictions of `cls`.
+    :type restrictions: dict
+    :return: function with signature (obj) returning the JSON string.
+    :rtype: types.FunctionType
+    """
+    source, namespace = serializer_source(cls, restrictions)
+    code = code_cache.compile(source, '<do_py serializer %s.%s>' % (cls.__module__, cls.__qualname__))
+    exec(code, namespace)
+    fn = namespace['_serializer_']
+    fn.__qualname__ = '%s._serializer_' % cls.__qualname__
+    return fn
@@ -3,8 +3,6 @@
 :date_created: 2019-08-18
 """
 
-import copy
-
 from do_py import DataObject
 from do_py.abc import ABCRestrictions
 
@@ -21,7 +19,8 @@ class Validator(DataObject):
 
     Users should implement _validate method and include the validation logic.
 
-    NOTE: This is heavy. Use ManagedRestrictions if possible.
+    NOTE: This is heavy. Use ManagedRestrictions if possible. When _validate only depends on some of the keys, declare
+    them in _validate_keys so that assignments to any other key skip _validate.
 
     Example:
         class Address(DataObject):
@@ -31,27 +30,42 @@ class Validator(DataObject):
                 }
 
     :attribute _validate: a validation function to validate data for mutually dependent keys
+    :attribute _validate_keys: optional keys _validate depends on. All keys by default.
     """
 
     _is_abstract_ = True
+    _validate_keys = None
+
+    @classmethod
+    def __compile__(cls):
+        """
+        Validate that the keys _validate depends on are restricted.
+        """
+        super(Validator, cls).__compile__()
+        if cls._validate_keys is not None:
+            for k in cls._validate_keys:
+                assert k in cls._restrictions, '%s._validate_keys: "%s" not in restrictions.' % (cls.__name__, k)
+            cls._validate_keys = frozenset(cls._validate_keys)
 
-    def __init__(self, data=None, strict=True):
-        super(Validator, self).__init__(data=data, strict=strict)
+    def __init__(self, data=None, strict=True, collect_errors=False):
+        super(Validator, self).__init__(data=data, strict=strict, collect_errors=collect_errors)
         if strict:
             self._validate()
 
     def __setitem__(self, key, value):
         """
-        A copy of current data is cached before running _validate. In case of exception, the data is restored using
-        the copy.
+        The current value of key is cached before running _validate. In case of exception, only that key is restored.
+        _validate is skipped for keys outside of _validate_keys.
         """
-        self_copy = copy.deepcopy(self)
+        previous = self[key]
         super(Validator, self).__setitem__(key, value)
+        if self._validate_keys is not None and key not in self._validate_keys:
+            return
         try:
             # Additional validation
             self._validate()
         except:
-            self(data=self_copy)
+            dict.__setitem__(self, key, previous)
             raise
 
     def _validate(self):
@@ -1,4 +1,5 @@
 from .data_object_error import DataObjectError
+from .lazy_message import LazyMessageError
 from .restriction_error import RestrictionError
 
-__all__ = ['DataObjectError', 'RestrictionError']
+__all__ = ['DataObjectError', 'LazyMessageError', 'RestrictionError']
@@ -1,21 +1,76 @@
-class DataObjectError(Exception):
+from .lazy_message import LazyMessageError, picklable
+
+
+def format_path(path):
+    """
+    Format a key path, e.g. ('lines', 2, 'id') as 'lines[2].id'.
+    :type path: tuple
+    :rtype: str
+    """
+    s = ''
+    for k in path:
+        s += '[%s]' % k if type(k) is int else ('.%s' % k if s else '%s' % k)
+    return s
+
+
+class DataObjectError(LazyMessageError):
     """
     Errors related to restriction and data keys.
+    :attribute key: The key the error occurred at, for run time errors.
+    :attribute cls_ref: The DO class the error occurred in, for run time errors.
+    :attribute restriction_error: The error captured from the restriction layer, see `from_restriction_error`.
+    :attribute errors: `(path, error)` for every failure when errors were collected, see `from_errors`.
     """
 
+    key = None
+    cls_ref = None
+    restriction_error = None
+    errors = ()
+
+    @property
+    def path(self):
+        """
+        Key path of the error, through nested DataObjects.
+        :rtype: tuple
+        """
+        if self.key is None:
+            return ()
+        return (self.key,) + getattr(self.restriction_error, 'path', ())
+
+    @property
+    def data(self):
+        """
+        The offending data, as reported by the restriction layer.
+        """
+        return getattr(self.restriction_error, 'data', None)
+
+    @property
+    def allowed(self):
+        """
+        The restriction the data violated, as reported by the restriction layer.
+        """
+        return getattr(self.restriction_error, 'allowed', None)
+
+    @classmethod
+    def _at(cls, key, cls_ref, template, *fields):
+        e = cls.lazy(template, *fields)
+        e.key = key
+        e.cls_ref = cls_ref
+        return e
+
     @classmethod
     def from_unknown_key(cls, key, cls_ref):
         """
         Compile time error. Not allowed to pass a key to DO that was not declared in restrictions.
         """
-        return cls("%s: Unexpected key '%s' in data." % (cls_ref.__name__, key))
+        return cls._at(key, cls_ref, "%s: Unexpected key '%s' in data.", cls_ref.__name__, key)
 
     @classmethod
     def from_required_key(cls, key, cls_ref):
         """
         Run time error. A required key was absent in data.
         """
-        return cls("%s: Key '%s' required in data." % (cls_ref.__name__, key))
+        return cls._at(key, cls_ref, "%s: Key '%s' required in data.", cls_ref.__name__, key)
 
     @classmethod
     def from_restriction_error(cls, key, cls_ref, restriction_error):
@@ -26,4 +81,62 @@ class DataObjectError(Exception):
         Movation:
         Catch -> Rethrow to add more information that would save debugging time.
         """
-        return cls('%s.%s: %s' % (cls_ref.__name__, key, restriction_error))
+        e = cls._at(key, cls_ref, '%s.%s: %s', cls_ref.__name__, key, restriction_error)
+        e.restriction_error = restriction_error
+        return e
+
+    @classmethod
+    def from_errors(cls, cls_ref, errors):
+        """
+        Run time error. All the failures collected while validating data, see `do_py.data_object.collect`.
+        :param errors: `(path, error)` for every failure. The path is a tuple of keys and list indexes.
+        :type errors: list[tuple[tuple, Exception]]
+        """
+        e = cls.lazy('%s: %s error(s) in data. %s', cls_ref.__name__, len(errors), _ErrorList(errors))
+        e.cls_ref = cls_ref
+        e.errors = errors
+        return e
+
+    @classmethod
+    def from_invalid_json(cls, cls_ref, reason):
+        """
+        Run time error. Serialized data could not be decoded into a dict for the DO.
+        """
+        e = cls.lazy('%s: Invalid JSON data. %s', cls_ref.__name__, reason)
+        e.cls_ref = cls_ref
+        return e
+
+    @classmethod
+    def from_line(cls, line_number, error):
+        """
+        Run time error. An error raised for a line of a file is enhanced by adding the line number.
+        """
+        return cls.lazy('Line %s: %s', line_number, error)
+
+    def _pickled_state(self):
+        """
+        The key, collected errors, and the class and restriction error when they can be pickled, are kept on
+        unpickling. The path, data and allowed restriction are read from the restriction error.
+        """
+        state = {}
+        if self.key is not None:
+            state['key'] = self.key
+        if self.errors:
+            state['errors'] = self.errors
+        if self.cls_ref is not None and picklable(self.cls_ref):
+            state['cls_ref'] = self.cls_ref
+        if self.restriction_error is not None and picklable(self.restriction_error):
+            state['restriction_error'] = self.restriction_error
+        return state or None
+
+
+class _ErrorList:
+    """
+    Formats collected errors when the message of DataObjectError.from_errors is read.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __str__(self):
+        return '; '.join(['%s: %s' % (format_path(p), err) for p, err in self.errors])
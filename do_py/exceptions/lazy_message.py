@@ -0,0 +1,74 @@
+"""
+:date_created: 2026-10-17
+"""
+
+import pickle
+
+
+def picklable(value):
+    """
+    :return: Whether value can be pickled. Classes and functions are pickled by reference, so they must be importable.
+    :rtype: bool
+    """
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+class LazyMessageError(Exception):
+    """
+    Base for errors raised at run time, where the message is only formatted when it is read. Errors like these are
+    raised and caught constantly, e.g. when strict initialization falls back to non-strict, and formatting the data
+    into a message would cost more than the validation that failed.
+
+    Errors built with `lazy` hold their message as `args`, formatted when `args` is read, as with `str`.
+    """
+
+    _template = None
+    _fields = ()
+
+    @classmethod
+    def lazy(cls, template, *fields):
+        """
+        Build an error whose message is `template % fields`, formatted on `str`.
+        :type template: str
+        :rtype: LazyMessageError
+        """
+        e = cls()
+        e._template = template
+        e._fields = fields
+        return e
+
+    @property
+    def args(self):
+        if self._template is None:
+            return BaseException.args.__get__(self)
+        return (str(self),)
+
+    @args.setter
+    def args(self, value):
+        self._template = None
+        BaseException.args.__set__(self, value)
+
+    def __str__(self):
+        if self._template is None:
+            return super(LazyMessageError, self).__str__()
+        return self._template % self._fields
+
+    def __repr__(self):
+        if self._template is None:
+            return super(LazyMessageError, self).__repr__()
+        return '%s(%r)' % (self.__class__.__name__, str(self))
+
+    def _pickled_state(self):
+        """
+        Attributes that are restored on unpickling, along with the message. Structured fields may reference classes and
+        data that cannot be pickled; those are dropped, see `picklable`.
+        :rtype: dict or None
+        """
+        return None
+
+    def __reduce__(self):
+        return self.__class__, (str(self),), self._pickled_state()
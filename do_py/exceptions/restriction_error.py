@@ -1,14 +1,25 @@
-class RestrictionError(Exception):
+from .lazy_message import LazyMessageError, picklable
+
+
+class RestrictionError(LazyMessageError):
     """
     Exceptions for Restrictions.
+    :attribute data: The offending data, for run time errors.
+    :attribute allowed: The restriction the data violated, for run time errors.
     """
 
+    data = None
+    allowed = None
+
     @classmethod
     def bad_data(cls, data, allowed):
         """
         Run time error. Data violated restrictions.
         """
-        return cls("'%s' not allowed per restriction '%s'" % (data, allowed))
+        e = cls.lazy("'%s' not allowed per restriction '%s'", data, allowed)
+        e.data = data
+        e.allowed = allowed
+        return e
 
     @classmethod
     def from_mixed_value_and_type(cls, allowed):
@@ -38,9 +49,24 @@ class RestrictionError(Exception):
         """
         return cls('Invalid default "%s".' % default)
 
+    @classmethod
+    def from_unhashable(cls, allowed, default):
+        """
+        Compile time error. Singleton restrictions are cached by their allowed values and default, which must be
+        hashable.
+        """
+        return cls("Unhashable restriction. Allowed '%s' with default '%s'." % (allowed, default))
+
     @classmethod
     def from_unsupported(cls, allowed):
         """
         Compile time error. Restriction syntax is incorrect.
         """
         return cls("Malformed restriction. Allowed '%s' is of type '%s'." % (allowed, type(allowed)))
+
+    def _pickled_state(self):
+        """
+        The data and the allowed restriction are kept on unpickling when they can be pickled.
+        """
+        state = {k: v for k, v in (('data', self.data), ('allowed', self.allowed)) if v is not None and picklable(v)}
+        return state or None
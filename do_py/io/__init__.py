@@ -0,0 +1,7 @@
+"""
+Readers building DataObjects from serialized data.
+"""
+
+from .ndjson import iter_ndjson
+
+__all__ = ['iter_ndjson']
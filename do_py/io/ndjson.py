@@ -0,0 +1,61 @@
+"""
+Streaming reader for newline-delimited JSON (NDJSON).
+:date_created: 2026-10-17
+"""
+
+import json
+
+from ..data_object.batch import OnError, builder
+from ..exceptions import DataObjectError
+
+CHUNK_SIZE = 1 << 20
+
+
+def iter_ndjson(cls, fileobj, strict=True, on_error=OnError.RAISE, errors=None, chunk_size=CHUNK_SIZE):
+    """
+    Lazily build an instance of `cls` for every line of a newline-delimited JSON file.
+
+    Lines are read in chunks of about `chunk_size` bytes, so memory use depends on the chunk size and not on the size
+    of the file. Blank lines are ignored. Line numbers start at 1 and count blank lines.
+    :param cls: DataObject class to build.
+    :type cls: ABCRestrictionMeta
+    :param fileobj: File object opened in text or binary mode.
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param on_error: How invalid lines are handled. See `do_py.data_object.batch.OnError`. With 'raise', the error is
+        re-raised with its line number.
+    :type on_error: str
+    :param errors: Receives `(line_number, DataObjectError)` for every invalid line when `on_error` is 'collect'.
+    :type errors: list
+    :param chunk_size: Size hint for each bulk read, see `io.IOBase.readlines`.
+    :type chunk_size: int
+    :rtype: collections.abc.Iterator
+    :raises DataObjectError: A line is not a valid JSON object or fails validation, and `on_error` is 'raise'.
+    """
+    OnError.check(on_error, errors)
+    build = builder(cls, strict=strict)
+    loads = json.loads
+    line_number = 0
+    while True:
+        lines = fileobj.readlines(chunk_size)
+        if not lines:
+            return
+        for line in lines:
+            line_number += 1
+            if line.isspace():
+                continue
+            try:
+                try:
+                    record = loads(line)
+                except ValueError as e:
+                    raise DataObjectError.from_invalid_json(cls, e) from e
+                if type(record) is not dict:
+                    raise DataObjectError.from_invalid_json(cls, 'Expected an object, got %s' % type(record).__name__)
+                instance = build(record)
+            except DataObjectError as e:
+                if on_error == OnError.RAISE:
+                    raise DataObjectError.from_line(line_number, e) from e
+                elif on_error == OnError.COLLECT:
+                    errors.append((line_number, e))
+                continue
+            yield instance
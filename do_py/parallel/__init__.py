@@ -0,0 +1,7 @@
+"""
+Validation of large record sets across processes.
+"""
+
+from .validate import validate_many
+
+__all__ = ['validate_many']
@@ -0,0 +1,150 @@
+"""
+Process-pool bulk validation of DataObject records.
+:date_created: 2026-10-17
+"""
+
+import copy
+import importlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from ..data_object.batch import OnError, builder
+from ..exceptions import DataObjectError
+
+CHUNK_SIZE = 1000
+
+# NOTE: Classes resolved by this worker process, keyed on import path.
+_classes = {}
+
+
+def import_path(cls):
+    """
+    The import path DataObject classes are shipped to workers by. Only the path crosses process boundaries.
+    :type cls: ABCRestrictionMeta
+    :rtype: tuple[str, str]
+    """
+    assert '<locals>' not in cls.__qualname__, '%s is not importable. Declare it at module level.' % cls.__qualname__
+    return cls.__module__, cls.__qualname__
+
+
+def resolve(path):
+    """
+    Import the class at path, once per process.
+    :type path: tuple[str, str]
+    :rtype: ABCRestrictionMeta
+    """
+    cls = _classes.get(path)
+    if cls is None:
+        module, qualname = path
+        cls = importlib.import_module(module)
+        for name in qualname.split('.'):
+            cls = getattr(cls, name)
+        _classes[path] = cls
+    return cls
+
+
+def validate_chunk(path, chunk, strict=True):
+    """
+    Validate a chunk of records. Runs in the worker processes.
+    :param path: See `import_path`.
+    :type path: tuple[str, str]
+    :type chunk: list[dict]
+    :type strict: bool
+    :return: For each record, `(True, data)` with the validated data as a plain dict, or `(False, DataObjectError)`.
+    :rtype: list[tuple]
+    """
+    build = builder(resolve(path), strict=strict)
+    results = []
+    for record in chunk:
+        try:
+            results.append((True, copy.deepcopy(build(record))))
+        except DataObjectError as e:
+            results.append((False, e))
+    return results
+
+
+def _chunks(records, chunksize):
+    it = iter(records)
+    while True:
+        chunk = list(islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_results(path, records, workers, chunksize, strict):
+    """
+    Validate chunks across the pool, keeping at most two chunks per worker in flight. Results are yielded in input
+    order.
+    """
+    chunks = _chunks(records, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from validate_chunk(path, chunk, strict=strict)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(validate_chunk, path, chunk, strict))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        except GeneratorExit:
+            # NOTE: Closed before every result was read. Chunks not started yet are cancelled; leaving the block still
+            # waits for the chunks the workers are validating.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def validate_many(cls, records, workers=None, chunksize=CHUNK_SIZE, strict=True, on_error=OnError.RAISE, errors=None):
+    """
+    Validate records with the restrictions of `cls` across a pool of worker processes.
+
+    Records are sent to workers in chunks along with the import path of `cls`; the class itself never crosses process
+    boundaries, so it must be importable, i.e. declared at module level. Validated data comes back as plain dicts,
+    nested DataObjects included (see `DataObject.__deepcopy__`). Use `cls.from_many` on the results when instances
+    are needed.
+
+    Example:
+        errors = []
+        rows = validate_many(A, records, workers=4, on_error='collect', errors=errors)
+        # errors: [(3, DataObjectError("A: Key 'id' required in data."))]
+    :param cls: DataObject class to validate against.
+    :type cls: ABCRestrictionMeta
+    :param records: Plain dicts to validate.
+    :param workers: Number of worker processes. Defaults to the number of CPUs. With 1, records are validated in
+        this process.
+    :type workers: int
+    :param chunksize: Number of records per task sent to a worker.
+    :type chunksize: int
+    :param strict: See Strict vs Non-strict initialization comments in DataObject._validate_data.
+    :type strict: bool
+    :param on_error: How invalid records are handled. See `do_py.data_object.batch.OnError`.
+    :type on_error: str
+    :param errors: Receives `(index, DataObjectError)` for each invalid record when on_error is 'collect'.
+    :type errors: list
+    :return: Validated data in input order.
+    :rtype: list[dict]
+    """
+    OnError.check(on_error, errors)
+    assert chunksize > 0, 'Invalid "chunksize"(=%s)' % chunksize
+    workers = workers or os.cpu_count() or 1
+    data = []
+    results = _iter_results(import_path(cls), records, workers, chunksize, strict)
+    try:
+        for i, (ok, result) in enumerate(results):
+            if ok:
+                data.append(result)
+            elif on_error == OnError.RAISE:
+                raise result
+            elif on_error == OnError.COLLECT:
+                errors.append((i, result))
+    finally:
+        # NOTE: Cancels the chunks not started yet when an error is raised. See `_iter_results`.
+        results.close()
+    return data
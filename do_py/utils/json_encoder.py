@@ -3,12 +3,14 @@
 """
 
 import json
+from array import array
+from collections.abc import Mapping
 from datetime import date, datetime
 
 
 class MyJSONEncoder(json.JSONEncoder):
     """
-    Custom JSON encoder used for adding encoding support to datetime/date.
+    Custom JSON encoder used for adding encoding support to datetime/date, to mappings that are not dicts and to arrays.
     """
 
     def default(self, obj):
@@ -20,4 +22,8 @@ class MyJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         elif isinstance(obj, date):
             return obj.isoformat()
+        elif isinstance(obj, Mapping):
+            return dict(obj)
+        elif isinstance(obj, array):
+            return obj.tolist()
         return super(MyJSONEncoder, self).default(obj)
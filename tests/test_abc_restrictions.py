@@ -257,6 +257,38 @@ class TestNestedNew:
         Leaf = type('Leaf', (Root,), {'x': 1, '__module__': __name__})
         assert Leaf.x == 1
 
+    def test_leaf_fast_path(self):
+        """Leaf with no explicit __new__ in its hierarchy should allocate with the base type's __new__ directly."""
+        Root = ABCRestrictions.require('x')(
+            type('Root', (dict,), {ConstABCR.is_abstract: True, '__module__': __name__})
+        )
+        Node = type('Node', (Root,), {ConstABCR.is_abstract: True, '__module__': __name__})
+        Leaf = type('Leaf', (Node,), {'x': 1, '__module__': __name__})
+        SubLeaf = type('SubLeaf', (Leaf,), {'__module__': __name__})
+        assert Leaf.__dict__['__new__'] is dict.__new__
+        assert SubLeaf.__dict__['__new__'] is dict.__new__
+        assert type(Leaf()) is Leaf
+        for abstract in [Root, Node]:
+            with pytest.raises(NotImplementedError):
+                abstract()
+
+    def test_leaf_fast_path_skipped_for_custom_new(self):
+        """An explicit __new__ anywhere in the hierarchy must still run for leaves."""
+        new_calls = []
+
+        def custom_new(cls, *args, **kwargs):
+            new_calls.append(cls.__name__)
+            return dict.__new__(cls, *args, **kwargs)
+
+        Root = ABCRestrictions.require('x')(
+            type('Root', (dict,), {ConstABCR.is_abstract: True, '__new__': custom_new, '__module__': __name__})
+        )
+        Leaf = type('Leaf', (Root,), {'x': 1, '__module__': __name__})
+        SubLeaf = type('SubLeaf', (Leaf,), {'__module__': __name__})
+        assert Leaf.__dict__['__new__'] is not dict.__new__
+        assert type(SubLeaf()) is SubLeaf
+        assert 'SubLeaf' in new_calls
+
 
 @pytest.mark.usefixtures('abc_cleanup')
 class TestRequireEdgeCases:
@@ -0,0 +1,33 @@
+"""
+Test that every benchmark case runs, and the baseline diffing of the benchmark runner.
+:date_created: 2026-10-17
+"""
+
+import json
+
+import pytest
+
+from benchmarks import run
+from benchmarks.cases import CASES
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_case(name):
+    CASES[name]()()
+
+
+class TestRunner:
+    def test_save_and_compare(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(run, 'measure', lambda setup, repeat=5: {'ns_per_call': 100.0, 'loops': 1})
+        path = str(tmp_path / 'baseline.json')
+        assert run.main(['-k', 'flat_strict', '--save', path]) == 0
+        with open(path) as f:
+            baseline = json.load(f)
+        assert baseline['results'] == {'construct.flat_strict': {'ns_per_call': 100.0, 'loops': 1}}
+
+        assert run.main(['-k', 'flat_strict', '--compare', path]) == 0
+        baseline['results']['construct.flat_strict']['ns_per_call'] = 50.0
+        with open(path, 'w') as f:
+            json.dump(baseline, f)
+        assert run.main(['-k', 'flat_strict', '--compare', path]) == 1
+        assert run.main(['-k', 'flat_strict', '--compare', path, '--threshold', '2.5']) == 0
@@ -318,3 +318,76 @@ class TestMgdDatetimeCrossTypeInputs:
         instance = MgdDatetime.from_from_datetime()
         with pytest.raises(RestrictionError):
             instance(test_date_instance_now.isoformat())
+
+
+ISO_INPUTS = [
+    '2019-09-25T10:00:00',
+    '2019-09-25',
+    '2019-09-25T23:59:59',
+    '2019-09-25T24:00:00',
+    '2019-09-25T23:59:60',
+    '2019-02-29T00:00:00',
+    '2019-02-29',
+    '2019-9-25T1:2:3',
+    '2019-9-5',
+    '2019-09-25t10:00:00',
+    '2019-09-25 10:00:00',
+    '2019-09-25T10:00:00.500000',
+    '2019-09-25T10:00:00+00:00',
+    '20190925',
+    '٢٠١٩-09-25T10:00:00',
+    ' 2019-09-25',
+    '',
+]
+
+
+def strptime_reference(value, dt_obj):
+    """
+    MgdDatetime parsing as implemented with strptime only.
+    """
+    try:
+        parsed = datetime.strptime(value, MgdDatetime._parse_dt_fmt[dt_obj])
+    except ValueError:
+        return RestrictionError
+    return parsed.date() if dt_obj is date else parsed
+
+
+class TestMgdDatetimeParse:
+    """Fast ISO parsing must accept and reject exactly what strptime does."""
+
+    @pytest.mark.parametrize('value', ISO_INPUTS)
+    @pytest.mark.parametrize('dt_obj', [datetime, date])
+    def test_strptime_parity(self, value, dt_obj):
+        instance = MgdDatetime(dt_obj=dt_obj)
+        expected = strptime_reference(value, dt_obj)
+        if expected is RestrictionError:
+            with pytest.raises(RestrictionError):
+                instance.parse(value)
+        else:
+            parsed = instance.parse(value)
+            assert parsed == expected and type(parsed) is type(expected)
+
+    def test_non_str(self):
+        with pytest.raises(TypeError):
+            MgdDatetime.datetime()(20190925)
+
+
+class TestMgdDatetimeManageMany:
+    @pytest.mark.parametrize(
+        'restriction, values',
+        [
+            (MgdDatetime.datetime(), ['2019-09-25T10:00:00', test_dt_instance, datetime(2019, 9, 25, 10, 0, 0, 5)]),
+            (MgdDatetime.null_date(), ['2019-09-25', None, test_date_instance_now, '2019-9-5']),
+            (MgdDatetime.from_from_datetime(), [None, '2019-09-25T10:00:00']),
+        ],
+    )
+    def test_same_as_calls(self, restriction, values):
+        assert restriction.manage_many(values) == [restriction(v) for v in values]
+
+    def test_invalid(self):
+        with pytest.raises(RestrictionError):
+            MgdDatetime.datetime().manage_many(['2019-09-25T10:00:00', '2019-02-29T00:00:00'])
+
+    def test_non_strict(self):
+        values = ['not a datetime', None]
+        assert MgdDatetime.datetime().manage_many(iter(values), strict=False) == values
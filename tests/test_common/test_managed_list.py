@@ -2,12 +2,21 @@
 :date_created: 2020-06-28
 """
 
+import copy
+import json
+import pickle
+import sys
+from array import array
+from random import Random
+
 import pytest
 
 from do_py import DataObject
 from do_py.common import R
-from do_py.common.managed_list import ManagedList, OrderedManagedList
-from do_py.exceptions import RestrictionError
+from do_py.common.managed_list import ManagedList, OrderedManagedList, PrimitiveManagedList, SortedList
+from do_py.data_object.restriction import ESR
+from do_py.exceptions import DataObjectError, RestrictionError
+from do_py.utils.json_encoder import MyJSONEncoder
 
 
 class Book(DataObject):
@@ -59,6 +68,15 @@ class TestManagedList:
         for book in lib.books:
             assert type(book) is Book
 
+    def test_do_instances_kept(self):
+        """DO instances are already validated, so they are kept rather than re-validated into copies."""
+        book = Book(self.book_1)
+        books = [book, self.book_2]
+        lib = Library({'books': books, 'shelves': None})
+        assert lib.books[0] is book
+        assert lib.books is not books
+        assert books[1] is self.book_2
+
     def test_non_nullable_none_raises(self):
         """Non-nullable ManagedList with None data should raise RestrictionError."""
         ml = ManagedList(Book, nullable=False)
@@ -85,7 +103,7 @@ class SortableItem(DataObject):
 
 
 class TestOrderedManagedList:
-    """Tests for OrderedManagedList (previously had # TODO: Unit tests)."""
+    """Tests for OrderedManagedList."""
 
     def test_basic_sorting(self):
         """Items should be sorted by the key function."""
@@ -146,6 +164,19 @@ class TestOrderedManagedList:
         container = SortedContainer(data)
         assert type(container.entries[0]) is SortableItem
 
+    def test_input_not_mutated(self):
+        """Sorting happens on the managed copy, never on the list passed in."""
+
+        class SortedContainer(DataObject):
+            _restrictions = {'entries': OrderedManagedList(SortableItem, key=lambda x: x.priority)}
+
+        first, second = SortableItem({'name': 'b', 'priority': 2}), SortableItem({'name': 'a', 'priority': 1})
+        entries = [first, second]
+        container = SortedContainer({'entries': entries})
+        assert container.entries == [second, first]
+        assert container.entries[0] is second
+        assert entries == [first, second]
+
     def test_empty_list(self):
         """Empty list should be valid and remain empty after sorting."""
 
@@ -166,3 +197,202 @@ class TestOrderedManagedList:
         ml = ManagedList(SortableItem)
         with pytest.raises(TypeError):
             ml(42)
+
+
+class Feed(DataObject):
+    _restrictions = {
+        'latest': OrderedManagedList(SortableItem, key=lambda x: x.priority, reverse=True),
+        'queue': OrderedManagedList(SortableItem, key=lambda x: x.priority),
+    }
+
+
+rng = Random(0)
+
+
+def item(name, priority):
+    return {'name': name, 'priority': priority}
+
+
+class TestSortedList:
+    def feed(self):
+        return Feed({'latest': [item('a', 1), item('b', 3)], 'queue': [item('c', 2), item('d', 1)]})
+
+    @staticmethod
+    def names(items):
+        return [x.name for x in items]
+
+    def test_sorted_list(self):
+        feed = self.feed()
+        assert type(feed.latest) is SortedList and type(feed.queue) is SortedList
+        assert self.names(feed.latest) == ['b', 'a'] and self.names(feed.queue) == ['d', 'c']
+
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_insert(self, reverse):
+        items = SortedList(SortableItem, key=lambda x: x.priority, reverse=reverse)
+        priorities = [rng.randrange(5) for _ in range(50)]
+        expected = []
+        for i, priority in enumerate(priorities):
+            items.append(item(str(i), priority))
+            expected.append(SortableItem(item(str(i), priority)))
+            assert items == sorted(expected, key=lambda x: x.priority, reverse=reverse)
+
+    @pytest.mark.parametrize('size', [1, 3, 100])
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_extend(self, size, reverse):
+        items = SortedList(
+            SortableItem, [item(str(i), i % 7) for i in range(40)], key=lambda x: x.priority, reverse=reverse
+        )
+        expected = list(items)
+        run = [item('new%s' % i, rng.randrange(7)) for i in range(size)]
+        items += run
+        expected.extend(SortableItem(x) for x in run)
+        assert items == sorted(expected, key=lambda x: x.priority, reverse=reverse)
+        assert all(type(x) is SortableItem for x in items)
+
+    def test_no_key(self):
+        items = SortedList(int, [3, 1, 2])
+        items.add(2)
+        assert items == [1, 2, 2, 3]
+
+    def test_positional_insert(self):
+        items = SortedList(int, [1, 2])
+        items.insert(0, 3)
+        assert items == [3, 1, 2]
+
+    def test_new_items_validated(self):
+        feed = self.feed()
+        with pytest.raises(DataObjectError):
+            feed.queue.add({'name': 'e'})
+        with pytest.raises(DataObjectError):
+            feed.queue.extend([item('e', 1), {'priority': 'high'}])
+        assert self.names(feed.queue) == ['d', 'c']
+
+    def test_copied_on_assignment(self):
+        feed, other = self.feed(), self.feed()
+        queue = feed.queue
+        queue.add(item('e', 0))
+        other.queue = queue
+        assert other.queue == queue and other.queue is not queue
+        assert type(other.queue) is SortedList and other.queue.key is queue.key
+        other.queue.add(item('f', 5))
+        assert self.names(queue) == ['e', 'd', 'c']
+        feed.latest = queue
+        assert self.names(feed.latest) == ['c', 'd', 'e']
+
+    @pytest.mark.parametrize(
+        'modify',
+        [
+            lambda items: items.insert(0, {'name': 'bad'}),
+            lambda items: items.__setitem__(0, {'name': 'bad'}),
+            lambda items: items.__setitem__(slice(0, 1), [{'name': 'bad'}]),
+        ],
+    )
+    def test_modified_validated_on_assignment(self, modify):
+        feed = self.feed()
+        modify(feed.queue)
+        assert feed.queue.modified
+        with pytest.raises(DataObjectError):
+            feed.queue = feed.queue
+
+    @pytest.mark.parametrize(
+        'modify',
+        [
+            lambda items: items.insert(0, item('z', 9)),
+            lambda items: items.reverse(),
+            lambda items: items.sort(key=lambda x: x.name, reverse=True),
+        ],
+    )
+    def test_modified_sorted_on_assignment(self, modify):
+        feed = self.feed()
+        modify(feed.queue)
+        feed.queue = feed.queue
+        assert [x.priority for x in feed.queue] == sorted(x.priority for x in feed.queue)
+        assert not feed.queue.modified
+
+    def test_copy(self):
+        feed = self.feed()
+        for copied in (copy.copy(feed.queue), copy.deepcopy(feed.queue), copy.deepcopy(feed)['queue']):
+            assert type(copied) is list and copied == feed.queue
+        assert all(type(x) is dict for x in copy.deepcopy(feed)['queue'])
+
+    def test_pickle(self):
+        feed = self.feed()
+        assert pickle.loads(pickle.dumps(feed.queue)) == feed.queue
+        assert pickle.loads(pickle.dumps(feed)) == feed
+
+    def test_to_json(self):
+        feed = self.feed()
+        assert feed.to_json() == json.dumps(feed, cls=MyJSONEncoder)
+
+
+class Series(DataObject):
+    _restrictions = {
+        'hours': PrimitiveManagedList(int, compact=True),
+        'readings': PrimitiveManagedList(float, nullable=True),
+        'flags': PrimitiveManagedList(bool),
+    }
+
+
+class TestPrimitiveManagedList:
+    series = {'hours': [0, 1, 2], 'readings': [0.5, float('nan'), 2.0], 'flags': [True, False, True]}
+
+    def test_valid(self):
+        series = Series(self.series)
+        assert series.hours == array('q', [0, 1, 2])
+        assert type(series.readings) is list and series.readings[0] == 0.5
+        assert series.flags == [True, False, True]
+
+    def test_copied(self):
+        flags = [True]
+        assert Series({**self.series, 'flags': flags}).flags is not flags
+
+    @pytest.mark.parametrize('data', [(0, 1), array('q', [0, 1]), array('i', [0, 1])])
+    def test_sequences(self, data):
+        assert PrimitiveManagedList(int, compact=True)(data) == array('q', [0, 1])
+        assert PrimitiveManagedList(int)(data) == [0, 1]
+
+    def test_compact_array_kept(self):
+        hours = array('q', [3, 4])
+        assert Series({**self.series, 'hours': hours}).hours is hours
+
+    @pytest.mark.parametrize(
+        'restriction, data',
+        [
+            (PrimitiveManagedList(int), [1, True]),
+            (PrimitiveManagedList(int), [1, 2.0]),
+            (PrimitiveManagedList(float), [1.0, 2]),
+            (PrimitiveManagedList(bool), [True, 1]),
+            (PrimitiveManagedList(int), None),
+            (PrimitiveManagedList(int), 'not a list'),
+            (PrimitiveManagedList(int), {1, 2}),
+            (PrimitiveManagedList(int, compact=True), [1, 2**63]),
+            (PrimitiveManagedList(float), array('q', [1])),
+        ],
+    )
+    def test_invalid(self, restriction, data):
+        with pytest.raises(RestrictionError):
+            restriction(data)
+
+    def test_nullable(self):
+        assert PrimitiveManagedList(float, nullable=True)(None) is None
+
+    @pytest.mark.parametrize('item_type, compact', [(str, False), (bool, True)])
+    def test_unsupported(self, item_type, compact):
+        with pytest.raises(AssertionError):
+            PrimitiveManagedList(item_type, compact=compact)
+
+    def test_to_json(self):
+        series = Series(self.series)
+        assert series.to_json() == json.dumps(dict(series), cls=MyJSONEncoder)
+        assert json.loads(series.to_json())['hours'] == [0, 1, 2]
+
+    def test_schema(self):
+        assert Series.schema == {'hours': ['int'], 'readings': ['float'], 'flags': ['bool']}
+        assert R(Series, type(None)).es_restrictions == {
+            'properties': {'hours': ESR.INT, 'readings': ESR.FLOAT, 'flags': ESR.BOOL}
+        }
+
+    def test_compact_size(self):
+        hours = list(range(1000, 2000))
+        compact = Series({**self.series, 'hours': hours}).hours
+        assert sys.getsizeof(compact) < (sys.getsizeof(hours) + sum(map(sys.getsizeof, hours))) / 3
@@ -0,0 +1,103 @@
+"""
+Test batch construction with DataObject.from_many and DataObject.iter_many.
+:date_created: 2026-10-17
+"""
+
+import types
+
+import pytest
+
+from do_py import DataObject
+from do_py.common import R
+from do_py.data_object.validator import Validator
+from do_py.exceptions import DataObjectError
+
+from ..data import A
+
+
+class Ordered(Validator):
+    _restrictions = {'low': R.INT, 'high': R.INT}
+
+    def _validate(self):
+        assert self.low <= self.high
+
+
+rows = [{'id': 1, 'name': 'a', 'status': 0}, {'id': 2, 'name': 'b', 'status': 3}, {'id': 3, 'name': 'c'}]
+
+
+class TestFromMany:
+    def test_valid(self):
+        objs = A.from_many(rows[:1])
+        assert objs == [A(rows[0])]
+        assert type(objs[0]) is A
+        assert vars(objs[0]) == vars(A(rows[0]))
+
+    def test_non_strict(self):
+        objs = A.from_many([{'id': 1}], strict=False)
+        assert objs == [A({'id': 1}, strict=False)]
+
+    def test_raise(self):
+        with pytest.raises(DataObjectError):
+            A.from_many(rows)
+
+    def test_skip(self):
+        assert A.from_many(rows, on_error='skip') == [A(rows[0])]
+
+    def test_collect(self):
+        errors = []
+        assert A.from_many(rows, on_error='collect', errors=errors) == [A(rows[0])]
+        assert [i for i, _ in errors] == [1, 2]
+        assert all(type(e) is DataObjectError for _, e in errors)
+
+    @pytest.mark.xfail(raises=AssertionError)
+    def test_collect_requires_errors(self):
+        A.from_many(rows, on_error='collect')
+
+    @pytest.mark.xfail(raises=AssertionError)
+    def test_invalid_policy(self):
+        A.from_many(rows, on_error='ignore')
+
+    def test_custom_init(self):
+        """
+        Classes overriding __init__ are instantiated normally.
+        """
+        assert Ordered.from_many([{'low': 1, 'high': 2}]) == [{'low': 1, 'high': 2}]
+        with pytest.raises(AssertionError):
+            Ordered.from_many([{'low': 3, 'high': 2}])
+
+    def test_abstract(self):
+        with pytest.raises(NotImplementedError):
+            DataObject.from_many([{}])
+
+    def test_custom_new(self):
+        """
+        Classes whose hierarchy declares __new__ are instantiated normally, so that __new__ runs.
+        """
+
+        class Guarded(DataObject):
+            _is_abstract_ = True
+
+            def __new__(cls, *args, **kwargs):
+                raise RuntimeError('Guarded')
+
+        class Leaf(Guarded):
+            _restrictions = {'x': R.INT}
+
+        with pytest.raises(RuntimeError):
+            Leaf({'x': 1})
+        with pytest.raises(RuntimeError):
+            Leaf.from_many([{'x': 1}])
+
+
+class TestIterMany:
+    @pytest.mark.parametrize('on_error, errors', [('ignore', None), ('collect', None)])
+    def test_arguments_checked(self, on_error, errors):
+        with pytest.raises(AssertionError):
+            A.iter_many(rows, on_error=on_error, errors=errors)
+
+    def test_lazy(self):
+        objs = A.iter_many(iter(rows), on_error='skip')
+        assert isinstance(objs, types.GeneratorType)
+        assert next(objs) == A(rows[0])
+        with pytest.raises(StopIteration):
+            next(objs)
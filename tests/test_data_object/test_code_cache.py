@@ -0,0 +1,113 @@
+"""
+Test the on-disk cache of code compiled for DataObject classes.
+:date_created: 2026-10-17
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import do_py
+from do_py import DataObject, R
+from do_py.data_object import code_cache as code_cache_module
+from do_py.data_object.code_cache import CodeCache
+from do_py.exceptions import DataObjectError
+
+SOURCE = 'def f():\n    return 1\n'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CodeCache(str(tmp_path / 'code'))
+
+
+def run(code):
+    namespace = {}
+    exec(code, namespace)
+    return namespace['f']()
+
+
+class TestCodeCache:
+    def test_disabled(self):
+        cache = CodeCache()
+        assert run(cache.compile(SOURCE, '<f>')) == 1
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'writes': 0, 'path': None}
+
+    def test_miss_then_hit(self, cache):
+        assert run(cache.compile(SOURCE, '<f>')) == 1
+        assert run(CodeCache(cache.path).compile(SOURCE, '<f>')) == 1
+        warm = CodeCache(cache.path)
+        code = warm.compile(SOURCE, '<f>')
+        assert code.co_filename == '<f>'
+        assert warm.stats()['hits'] == 1 and warm.stats()['misses'] == 0
+        assert cache.stats() == {'hits': 0, 'misses': 1, 'writes': 1, 'path': cache.path}
+
+    def test_keyed_on_source(self, cache):
+        cache.compile(SOURCE, '<f>')
+        assert run(cache.compile(SOURCE.replace('1', '2'), '<f>')) == 2
+        cache.compile(SOURCE, '<g>')
+        assert cache.misses == 3
+        assert len(os.listdir(cache.path)) == 3
+
+    def test_corrupt_entry(self, cache):
+        cache.compile(SOURCE, '<f>')
+        with open(os.path.join(cache.path, cache.key(SOURCE, '<f>')), 'wb') as f:
+            f.write(b'\x00')
+        assert run(cache.compile(SOURCE, '<f>')) == 1
+        assert cache.misses == 2 and cache.writes == 2
+
+    def test_unwritable(self, tmp_path):
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+        cache = CodeCache(str(blocker / 'code'))
+        assert run(cache.compile(SOURCE, '<f>')) == 1
+        assert cache.writes == 0
+
+    def test_clear(self, cache):
+        cache.compile(SOURCE, '<f>')
+        cache.clear()
+        assert os.listdir(cache.path) == []
+        assert cache.stats()['misses'] == 0
+
+    def test_data_object(self, cache, monkeypatch):
+        monkeypatch.setattr(code_cache_module.code_cache, 'path', cache.path)
+
+        def declare():
+            class Cached(DataObject):
+                _restrictions = {'id': R.INT, 'name': R.NULL_STR}
+
+            return Cached
+
+        # NOTE: One validator and one serializer per class, the validator being compiled on first use.
+        first = declare()
+        second = declare()
+        for cls in (first, second):
+            assert cls(data={'id': 1, 'name': None}).to_json() == '{"id": 1, "name": null}'
+            with pytest.raises(DataObjectError, match='name'):
+                cls(data={'id': 1})
+        assert len(os.listdir(cache.path)) == 2
+
+    def test_environment(self, tmp_path):
+        path = str(tmp_path / 'code')
+        script = textwrap.dedent(
+            """
+            from do_py import DataObject, R
+            from do_py.data_object.code_cache import code_cache
+
+            class A(DataObject):
+                _restrictions = {'x': R.INT}
+
+            A({'x': 1}).to_json()
+            print(code_cache.stats()['hits'])
+            """
+        )
+        env = dict(os.environ, DO_PY_CODE_CACHE=path, PYTHONPATH=os.path.dirname(os.path.dirname(do_py.__file__)))
+        outputs = [
+            subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True).stdout
+            for _ in range(2)
+        ]
+        assert int(outputs[0]) == 0
+        assert int(outputs[1]) >= 2
@@ -0,0 +1,106 @@
+"""
+Test collecting all validation failures with collect_errors=True.
+:date_created: 2026-10-17
+"""
+
+import pickle
+
+import pytest
+
+from do_py import DataObject
+from do_py.common import R
+from do_py.common.managed_list import ManagedList
+from do_py.data_object.validator import Validator
+from do_py.exceptions import DataObjectError
+from do_py.exceptions.data_object_error import format_path
+
+from ..data import A
+
+
+class Range(Validator):
+    _restrictions = {'low': R.INT, 'high': R.INT}
+
+    def _validate(self):
+        if self.low > self.high:
+            raise DataObjectError('low > high')
+
+
+class Order(DataObject):
+    _restrictions = {
+        'id': R.INT,
+        'customer': A,
+        'referrer': R(A, type(None)),
+        'lines': ManagedList(A),
+        'range': Range,
+    }
+
+
+a = {'id': 1, 'name': 'a', 'status': 0}
+valid = {'id': 1, 'customer': a, 'referrer': None, 'lines': [a], 'range': {'low': 1, 'high': 2}}
+invalid = {
+    'id': 'x',
+    'customer': {'id': 1, 'name': 2, 'status': 5},
+    'referrer': 'nope',
+    'lines': [a, {'id': 1, 'status': 0}, a, 7],
+    'range': {'low': 3, 'high': 2},
+    'extra': True,
+}
+
+
+def paths(e):
+    return [format_path(p) for p, _ in e.errors]
+
+
+class TestCollectErrors:
+    def test_valid(self):
+        assert Order(valid, collect_errors=True) == Order(valid)
+
+    def test_all_failures(self):
+        with pytest.raises(DataObjectError) as e:
+            Order(invalid, collect_errors=True)
+        assert paths(e.value) == [
+            'extra',
+            'id',
+            'customer.name',
+            'customer.status',
+            'referrer',
+            'lines[1].name',
+            'lines[3]',
+            'range',
+        ]
+        assert str(e.value).startswith('Order: 8 error(s) in data. extra: ')
+        assert "lines[1].name: A: Key 'name' required in data." in str(e.value)
+
+    def test_first_failure_by_default(self):
+        with pytest.raises(DataObjectError) as e:
+            Order(invalid)
+        assert e.value.errors == ()
+
+    def test_missing_keys(self):
+        with pytest.raises(DataObjectError) as e:
+            A({}, collect_errors=True)
+        assert paths(e.value) == ['id', 'name', 'status']
+        with pytest.raises(DataObjectError) as e:
+            A({'status': 9}, strict=False, collect_errors=True)
+        assert paths(e.value) == ['status']
+
+    def test_pickle(self):
+        with pytest.raises(DataObjectError) as e:
+            A({}, collect_errors=True)
+        assert paths(pickle.loads(pickle.dumps(e.value))) == ['id', 'name', 'status']
+
+    def test_validator(self):
+        with pytest.raises(DataObjectError) as e:
+            Range({'low': 'x'}, collect_errors=True)
+        assert paths(e.value) == ['low', 'high']
+
+    def test_from_many(self):
+        errors = []
+        objs = Order.from_many([valid, invalid], on_error='collect', errors=errors, collect_errors=True)
+        assert objs == [valid]
+        assert [i for i, _ in errors] == [1]
+        assert len(errors[0][1].errors) == 8
+
+    def test_format_path(self):
+        assert format_path(()) == ''
+        assert format_path(('a', 0, 'b', 1, 2)) == 'a[0].b[1][2]'
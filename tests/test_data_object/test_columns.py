@@ -0,0 +1,120 @@
+"""
+Test columnar validation with DataObject.validate_columns.
+:date_created: 2026-10-17
+"""
+
+import datetime
+
+import pytest
+
+from do_py import DataObject
+from do_py.common import R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.data_object.compact import CompactDataObject
+from do_py.data_object.validator import Validator
+from do_py.exceptions import DataObjectError
+
+
+class Point(DataObject):
+    _restrictions = {'x': R.INT, 'y': R.INT}
+
+
+class Event(DataObject):
+    _restrictions = {
+        'id': R.INT,
+        'kind': R('open', 'close'),
+        'tags': R(),
+        'at': MgdDatetime.datetime(),
+        'point': R(Point, type(None)),
+        'note': R.NULL_STR,
+    }
+
+
+class Ordered(Validator):
+    _restrictions = {'low': R.INT, 'high': R.INT}
+
+    def _validate(self):
+        assert self.low <= self.high
+
+
+class CompactPoint(CompactDataObject):
+    _restrictions = {'x': R.INT, 'y': R.INT}
+
+
+def transpose(columns):
+    keys = list(columns)
+    return [dict(zip(keys, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+
+
+COLUMNS = {
+    'id': [1, 2, 'three', 4, 5],
+    'kind': ['open', 'close', 'open', 'reopen', 'close'],
+    'tags': [[], ['a'], None, 1, 'b'],
+    'at': ['2026-10-17T12:30:00', 'bad', '2026-10-17', '2026-10-17T00:00:00', '2026-10-17T01:00:00'],
+    'point': [None, {'x': 1, 'y': 2}, None, {'x': 1}, {'x': 3, 'y': 4}],
+    'note': [None, 'x', 'y', None, 'z'],
+}
+
+
+class TestValidateColumns:
+    def test_valid(self):
+        columns = {k: [v[0], v[4]] for k, v in COLUMNS.items()}
+        validated = Event.validate_columns(columns)
+        assert list(validated) == list(Event._restrictions)
+        assert validated['at'] == [datetime.datetime(2026, 10, 17, 12, 30), datetime.datetime(2026, 10, 17, 1)]
+        assert type(validated['point'][1]) is Point
+        rows = list(Event.validate_columns(columns, as_rows=True))
+        assert rows == Event.from_many(transpose(columns))
+        assert type(rows[1]) is Event and rows[1]._strict
+
+    @pytest.mark.parametrize('on_error', ['skip', 'collect'])
+    def test_parity(self, on_error):
+        column_errors, row_errors = [], []
+        validated = Event.validate_columns(COLUMNS, on_error=on_error, errors=column_errors)
+        rows = Event.from_many(transpose(COLUMNS), on_error=on_error, errors=row_errors)
+        assert transpose(validated) == rows
+        assert [(i, str(e)) for i, e in column_errors] == [(i, str(e)) for i, e in row_errors]
+
+    def test_raise(self):
+        with pytest.raises(DataObjectError) as column_error:
+            Event.validate_columns(COLUMNS)
+        with pytest.raises(DataObjectError) as row_error:
+            Event.from_many(transpose(COLUMNS))
+        assert str(column_error.value) == str(row_error.value)
+
+    def test_unknown_column(self):
+        errors = []
+        assert Point.validate_columns({'x': [1, 2], 'z': [3, 4]}, on_error='collect', errors=errors) == {}
+        assert [i for i, _ in errors] == [0, 1]
+
+    def test_missing_column(self):
+        with pytest.raises(DataObjectError):
+            Point.validate_columns({'x': [1]})
+        assert Point.validate_columns({'x': [1]}, strict=False) == {'x': [1], 'y': [None]}
+
+    def test_unhashable_values(self):
+        class Choice(DataObject):
+            _restrictions = {'v': R(1, 2)}
+
+        errors = []
+        assert Choice.validate_columns({'v': [1, [1], 2]}, on_error='collect', errors=errors) == {'v': [1, 2]}
+        assert [i for i, _ in errors] == [1]
+
+    def test_empty(self):
+        assert Point.validate_columns({}) == {'x': [], 'y': []}
+        assert Point.validate_columns({'x': [], 'y': []}) == {'x': [], 'y': []}
+
+    def test_lengths(self):
+        with pytest.raises(AssertionError):
+            Point.validate_columns({'x': [1, 2], 'y': [1]})
+
+    @pytest.mark.parametrize('cls', [Ordered, CompactPoint])
+    def test_not_direct(self, cls):
+        keys = list(cls._restrictions)
+        columns = {keys[0]: [1, 2, 'x'], keys[1]: [2, 2, 2]}
+        errors = []
+        validated = cls.validate_columns(columns, on_error='collect', errors=errors)
+        expected = cls.from_many(transpose(columns), on_error='skip')
+        assert validated == {k: [obj[k] for obj in expected] for k in keys}
+        assert [i for i, _ in errors] == [2]
+        assert list(cls.validate_columns(columns, on_error='skip', as_rows=True)) == expected
@@ -0,0 +1,112 @@
+"""
+Test slot-backed CompactDataObject storage.
+:date_created: 2026-10-17
+"""
+
+import copy
+import json
+import pickle
+import sys
+from collections.abc import Mapping
+
+import pytest
+
+from do_py import DataObject
+from do_py.common import R
+from do_py.common.managed_list import ManagedList
+from do_py.data_object.compact import CompactDataObject
+from do_py.exceptions import DataObjectError, RestrictionError
+from do_py.utils.json_encoder import MyJSONEncoder
+
+
+class Point(CompactDataObject):
+    _restrictions = {'x': R.INT, 'y': R.INT, 'label': R.NULL_STR}
+
+
+class DictPoint(DataObject):
+    _restrictions = {'x': R.INT, 'y': R.INT, 'label': R.NULL_STR}
+
+
+class Shape(DataObject):
+    _restrictions = {'origin': Point, 'center': R(Point, type(None)), 'points': ManagedList(Point)}
+
+
+data = {'x': 1, 'y': 2, 'label': None}
+
+
+class TestCompactDataObject:
+    def test_mapping_api(self):
+        p = Point(data)
+        assert isinstance(p, Mapping)
+        assert not isinstance(p, dict)
+        assert p == data == dict(p) == copy.copy(p)
+        assert p['x'] == p.x == p.get('x') == 1
+        assert p.get('z', 3) == 3
+        assert list(p) == list(p.keys()) == ['x', 'y', 'label']
+        assert p.values() == [1, 2, None]
+        assert p.items() == list(data.items())
+        assert 'x' in p and 'z' not in p
+        assert len(p) == 3
+
+    def test_no_instance_dict(self):
+        p = Point(data)
+        assert not hasattr(p, '__dict__')
+        with pytest.raises(AttributeError):
+            p.z = 1
+
+    def test_validation_on_write(self):
+        p = Point(data)
+        p.x = 5
+        p['y'] = 6
+        assert p == {'x': 5, 'y': 6, 'label': None}
+        with pytest.raises(RestrictionError):
+            p.x = 'five'
+        with pytest.raises(KeyError):
+            p['z'] = 1
+        assert p.x == 5
+
+    def test_validation_on_init(self):
+        with pytest.raises(DataObjectError):
+            Point({'x': 1})
+        assert Point({'x': 1}, strict=False) == {'x': 1, 'y': None, 'label': None}
+
+    def test_abstract(self):
+        with pytest.raises(NotImplementedError):
+            CompactDataObject()
+
+    def test_subclass(self):
+        class Point3D(Point):
+            pass
+
+        assert Point3D.__slots__ == ()
+        assert Point3D(data) == data
+
+    def test_serialization(self):
+        p = Point(data)
+        assert repr(p) == repr(DictPoint(data))
+        assert str(p) == 'Point%s' % data
+        assert json.dumps({'p': p}, cls=MyJSONEncoder) == json.dumps({'p': data})
+        assert pickle.loads(pickle.dumps(p)) == p
+        assert copy.deepcopy(p) == data
+        assert type(copy.deepcopy(p)) is dict
+
+    def test_nested(self):
+        shape = Shape({'origin': data, 'center': Point(data), 'points': [data, Point(data)]})
+        assert type(shape.origin) is Point
+        assert type(shape.center) is Point
+        assert all(type(p) is Point for p in shape.points)
+        assert json.loads(repr(shape)) == {'origin': data, 'center': data, 'points': [data, data]}
+        assert Shape.schema['origin'] == Point.schema
+
+    def test_from_many(self):
+        assert Point.from_many([data, data]) == [data, data]
+
+    def test_memory(self):
+        """
+        Compare the memory footprint of the compact and the dict-backed layout.
+        """
+        compact = Point(data)
+        dict_backed = DictPoint(data)
+        compact_size = sys.getsizeof(compact) + sys.getsizeof(compact._values)
+        dict_size = sys.getsizeof(dict_backed) + sys.getsizeof(vars(dict_backed))
+        assert compact_size < dict_size / 2
@@ -0,0 +1,87 @@
+"""
+Test the per-class validators generated at compile time.
+:date_created: 2026-10-17
+"""
+
+import pytest
+
+from do_py import DataObject
+from do_py.common import R
+from do_py.common.managed_list import ManagedList
+from do_py.data_object.compiler import validator_source
+from do_py.exceptions import DataObjectError
+
+
+class Leaf(DataObject):
+    _restrictions = {'id': R.INT, 'status': R(0, 1, 2), 'any': R(), 'name': R.NULL_STR.with_default('x')}
+
+
+class Tree(DataObject):
+    _restrictions = {'leaf': Leaf, 'maybe': R(Leaf, type(None)), 'leaves': ManagedList(Leaf)}
+
+
+leaf = {'id': 1, 'status': 0, 'any': [1], 'name': None}
+
+cases = [
+    (Leaf, leaf, True),
+    (Leaf, None, False),
+    (Leaf, {'id': 1}, False),
+    (Leaf, {'id': 1}, True),
+    (Leaf, {'id': 'one', 'status': 0, 'any': None, 'name': None}, True),
+    (Leaf, {'id': 1, 'status': 3, 'any': None, 'name': None}, True),
+    (Leaf, {'id': 1, 'unknown': 1}, False),
+    (Tree, {'leaf': leaf, 'maybe': None, 'leaves': [leaf, Leaf(leaf)]}, True),
+    (Tree, {'leaf': Leaf(leaf), 'maybe': leaf, 'leaves': []}, True),
+    (Tree, {'leaf': leaf, 'maybe': 'leaf', 'leaves': []}, True),
+    (Tree, {'leaf': leaf, 'maybe': None, 'leaves': None}, True),
+    (Tree, {'leaf': {'id': 1}, 'maybe': None, 'leaves': []}, True),
+    (Tree, None, False),
+]
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except DataObjectError as e:
+        return DataObjectError, str(e)
+
+
+class TestCompiledValidator:
+    def test_leaf_classes_are_compiled(self):
+        Tree({'leaf': leaf, 'maybe': None, 'leaves': []})
+        assert Leaf.__dict__['_validator_'] is not Tree.__dict__['_validator_']
+        assert DataObject._validator_ is None
+
+    def test_compiled_on_first_use(self):
+        class Late(DataObject):
+            _restrictions = {'x': R.INT}
+
+        assert '_validator_' not in Late.__dict__
+        Late({'x': 1})
+        validator = Late.__dict__['_validator_']
+        Late({'x': 2})
+        assert Late.__dict__['_validator_'] is validator
+
+    @pytest.mark.parametrize('cls, data, strict', cases)
+    def test_matches_generic_validation(self, cls, data, strict):
+        """
+        Passing a copy of the restrictions bypasses the compiled validator.
+        """
+        compiled = outcome(lambda: cls._validate_data(cls._restrictions, data, strict=strict))
+        generic = outcome(lambda: cls._validate_data(dict(cls._restrictions), data, strict=strict))
+        assert compiled == generic
+
+    def test_nested_instances_are_reused(self):
+        child = Leaf(leaf)
+        assert Tree({'leaf': child, 'maybe': None, 'leaves': []}).leaf is child
+
+    def test_error_chaining(self):
+        with pytest.raises(DataObjectError) as e:
+            Leaf({'id': 1, 'status': 3, 'any': None, 'name': None})
+        assert e.value.__cause__ is not None
+
+    def test_source(self):
+        source, namespace = validator_source(Leaf, Leaf._restrictions)
+        assert source.startswith('def _validator_(cls, d, strict):')
+        assert namespace['_a0'] == frozenset([int])
+        assert '_r2(' not in source, 'Unrestricted keys should not be called.'
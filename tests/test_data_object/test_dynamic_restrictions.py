@@ -144,6 +144,24 @@ class TestDynamicInstanceIsolation:
         Breakfast({'item': 'milk', 'item_metadata': {'flavor': 'chocolate'}})
         assert Breakfast._restrictions['item_metadata'] == R()
 
+    def test_restrictions_shared_per_value(self):
+        """Instances with the same independent value share one resolved restrictions dict."""
+        milk_1 = Breakfast({'item': 'milk', 'item_metadata': {'flavor': 'chocolate'}})
+        milk_2 = Breakfast({'item': 'milk', 'item_metadata': {'flavor': 'normal'}})
+        cereal = Breakfast({'item': 'cereal', 'item_metadata': {'brand': 'cheerios'}})
+        assert milk_1._restrictions is milk_2._restrictions
+        assert milk_1._restrictions is not cereal._restrictions
+        assert milk_1._restrictions['name'] is Breakfast._restrictions['name']
+
+    def test_independent_key_update_switches_restrictions(self):
+        """Updating the independent key points the instance to the other value's restrictions."""
+        breakfast = Breakfast({'item': 'milk', 'item_metadata': {'flavor': 'chocolate'}})
+        breakfast['item_metadata'] = {'flavor': 'normal'}
+        with pytest.raises(DataObjectError):
+            breakfast['item'] = 'cereal'
+        assert breakfast._restrictions['item_metadata'] == CerealMetadata
+        assert Breakfast._restrictions['item_metadata'] == R()
+
 
 class TestDynamicRestrictionsManagedRestriction:
     """Direct tests for the DynamicRestrictions ManagedRestrictions class."""
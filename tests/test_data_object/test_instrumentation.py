@@ -0,0 +1,95 @@
+"""
+Test the opt-in instrumentation of DataObject validation.
+:date_created: 2026-10-17
+"""
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.data_object.instrumentation import instrumentation
+from do_py.data_object.lazy import LazyDataObject
+from do_py.exceptions import DataObjectError
+
+
+class Point(DataObject):
+    _restrictions = {'x': R.INT, 'y': R.INT}
+
+
+class Shape(DataObject):
+    _restrictions = {'name': R('circle', 'square'), 'center': Point, 'created': MgdDatetime.datetime()}
+
+
+class LazyShape(LazyDataObject):
+    _restrictions = {'name': R('circle', 'square'), 'center': Point}
+
+
+SHAPE = {'name': 'circle', 'center': {'x': 1, 'y': 2}, 'created': '2026-10-17T12:30:00'}
+POINT = '%s.Point' % __name__
+SHAPE_NAME = '%s.Shape' % __name__
+MGD_DATETIME = 'do_py.common.managed_datetime.MgdDatetime'
+
+
+@pytest.fixture
+def recording():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled(self):
+        instrumentation.reset()
+        Shape(SHAPE)
+        assert instrumentation.snapshot() == {'classes': {}, 'managed': {}}
+
+    def test_counts(self, recording):
+        expected = dict(Shape(SHAPE))
+        recording.disable()
+        assert dict(Shape(SHAPE)) == expected
+        snapshot = recording.snapshot()
+        shape = snapshot['classes'][SHAPE_NAME]
+        assert shape['count'] == 1 and shape['failures'] == 0
+        assert set(shape['keys']) == {'name', 'center', 'created'}
+        assert all(v['calls'] == 1 and v['failures'] == 0 for v in shape['keys'].values())
+        assert shape['keys']['center']['time'] <= shape['time']
+        assert snapshot['classes'][POINT]['count'] == 1
+        assert snapshot['managed'] == {MGD_DATETIME: {'calls': 1, 'failures': 0, 'time': pytest.approx(0, abs=1)}}
+
+    @pytest.mark.parametrize(
+        'data, key',
+        [
+            ({**SHAPE, 'name': 'triangle'}, 'name'),
+            ({'name': 'circle', 'created': None}, 'center'),
+            ({**SHAPE, 'color': 'red'}, 'color'),
+        ],
+    )
+    def test_failures(self, recording, data, key):
+        with pytest.raises(DataObjectError):
+            Shape(data)
+        shape = recording.snapshot()['classes'][SHAPE_NAME]
+        assert shape['count'] == 1 and shape['failures'] == 1
+        assert shape['keys'][key]['failures'] == 1
+
+    def test_managed_failure(self, recording):
+        with pytest.raises(DataObjectError):
+            Shape({**SHAPE, 'created': 'not a datetime'})
+        assert recording.snapshot()['managed'][MGD_DATETIME]['failures'] == 1
+        assert recording.snapshot()['classes'][SHAPE_NAME]['keys']['created']['failures'] == 1
+
+    def test_non_strict(self, recording):
+        Shape({'name': 'square'}, strict=False)
+        assert set(recording.snapshot()['classes'][SHAPE_NAME]['keys']) == {'name'}
+
+    def test_lazy(self, recording):
+        shape = LazyShape({'name': 'circle', 'center': {'x': 1, 'y': 2}})
+        assert POINT not in recording.snapshot()['classes']
+        assert shape.center.x == 1
+        assert recording.snapshot()['classes'][POINT]['count'] == 1
+
+    def test_reset(self, recording):
+        Point({'x': 1, 'y': 2})
+        recording.reset()
+        assert recording.snapshot() == {'classes': {}, 'managed': {}}
@@ -0,0 +1,124 @@
+"""
+Test lazy materialization of nested DataObjects with LazyDataObject.
+:date_created: 2026-10-17
+"""
+
+import copy
+import json
+
+import pytest
+
+from do_py.common import R
+from do_py.common.managed_list import ManagedList, OrderedManagedList
+from do_py.data_object.lazy import LazyDataObject
+from do_py.exceptions import DataObjectError
+
+from ..data import A
+
+
+class Order(LazyDataObject):
+    _restrictions = {'id': R.INT, 'customer': A, 'referrer': R(A, type(None)), 'lines': ManagedList(A)}
+
+
+class Unchecked(LazyDataObject):
+    _shallow_check = False
+    _restrictions = {'customer': A}
+
+
+class Tree(LazyDataObject):
+    _restrictions = {'name': R.STR, 'order': Order}
+
+
+a = {'id': 1, 'name': 'a', 'status': 0}
+bad = {'id': 1, 'name': 'a', 'status': 5}
+payload = {'id': 7, 'customer': a, 'referrer': None, 'lines': [a, a]}
+
+
+class TestLazyDataObject:
+    def test_deferred_until_access(self):
+        order = Order(payload)
+        assert dict.__getitem__(order, 'customer') is a
+        assert set(order._pending) == {'customer', 'lines'}
+        assert type(order.customer) is A
+        assert type(order['customer']) is A
+        assert set(order._pending) == {'lines'}
+        assert all(type(line) is A for line in order.get('lines'))
+        assert not order._pending
+
+    def test_error_at_access(self):
+        order = Order(dict(payload, customer=bad))
+        with pytest.raises(DataObjectError):
+            _ = order.customer
+        # NOTE: The failing key stays pending.
+        with pytest.raises(DataObjectError):
+            order['customer']
+        assert order.id == 7
+
+    def test_shallow_check(self):
+        with pytest.raises(DataObjectError):
+            Order(dict(payload, customer='a'))
+        with pytest.raises(DataObjectError):
+            Order(dict(payload, lines={'a': a}))
+        with pytest.raises(DataObjectError):
+            Order(dict(payload, customer=None))
+        assert Order(dict(payload, referrer=a)).referrer == a
+
+    def test_no_shallow_check(self):
+        obj = Unchecked({'customer': None})
+        with pytest.raises(DataObjectError):
+            _ = obj.customer
+
+    def test_validate_all(self):
+        tree = Tree({'name': 'x', 'order': dict(payload, lines=[a, bad])})
+        with pytest.raises(DataObjectError):
+            tree.validate_all()
+        tree = Tree({'name': 'x', 'order': payload})
+        assert tree.validate_all() is tree
+        assert not tree._pending and not tree.order._pending
+        assert type(tree.order.lines[0]) is A
+
+    def test_materialized_values(self):
+        order = Order(dict(payload, customer=A(a)))
+        assert 'customer' not in order._pending
+        assert order.items() == [('id', 7), ('customer', a), ('referrer', None), ('lines', [a, a])]
+        assert type(order.values()[1]) is A
+
+    def test_setitem(self):
+        order = Order(payload)
+        order.customer = dict(a, name='b')
+        assert 'customer' not in order._pending
+        assert type(order.customer) is A and order.customer.name == 'b'
+
+    def test_non_strict(self):
+        order = Order({'id': 1}, strict=False)
+        assert type(order.customer) is A
+        assert order.lines is None
+
+    def test_serialization(self):
+        tree = Tree({'name': 'x', 'order': payload})
+        assert json.loads(repr(tree)) == {'name': 'x', 'order': payload}
+        assert copy.deepcopy(Order(payload)) == payload
+        assert type(copy.copy(Order(payload))['customer']) is A
+
+    @pytest.mark.parametrize(
+        'convert',
+        [dict, lambda order: {**order}, lambda order: order == payload, lambda order: payload != order, json.dumps],
+    )
+    def test_conversion_validates(self, convert):
+        with pytest.raises(DataObjectError):
+            convert(Order(dict(payload, customer=bad)))
+
+    def test_conversion(self):
+        order = Order(payload)
+        assert type(dict(order)['customer']) is A and not order._pending
+        assert {**Order(payload)} == payload
+        assert Order(payload) == Order(payload) and not Order(payload) != payload
+
+    def test_validate_all_ordered_list(self):
+        class Queue(LazyDataObject):
+            _restrictions = {'trees': OrderedManagedList(Tree, key=lambda tree: tree.name)}
+
+        queue = Queue({'trees': [{'name': 'x', 'order': dict(payload, customer=bad)}]})
+        assert type(queue.trees[0]) is Tree
+        with pytest.raises(DataObjectError):
+            queue.validate_all()
@@ -149,3 +149,42 @@ class TestCompileTimeRestrictions:
 
         with pytest.raises(DataObjectError):
             type('Mixed', (DataObject,), {'_restrictions': {'id': [First, Second]}, '__module__': 'pytest'})
+
+    def test_default_not_shared(self):
+        built = []
+
+        class Leaf(DataObject):
+            _restrictions = {'x': R.INT.with_default(1)}
+
+            def __init__(self, *args, **kwargs):
+                built.append(self)
+                super(Leaf, self).__init__(*args, **kwargs)
+
+        class Branch(DataObject):
+            _restrictions = {'leaf': Leaf}
+
+        class Tree(DataObject):
+            _restrictions = {'branch': Branch}
+
+        assert built == []
+        first = Tree(strict=False)
+        second = Tree(strict=False)
+        assert len(built) == 2
+        assert first.branch is not second.branch
+        assert first.branch.leaf is not second.branch.leaf
+        first.branch.leaf.x = 2
+        assert second.branch.leaf.x == 1
+        assert Tree._restrictions['branch'].default is not Tree._restrictions['branch'].default
+
+    @pytest.mark.parametrize('restriction', [A, R(A, type(None))], ids=['A', '[A, type(None)]'])
+    def test_nested_instance_kept(self, restriction):
+        class Holder(DataObject):
+            _restrictions = {'a': restriction}
+
+        a = A(data={'id': 1, 'name': 'evil-jenkins', 'status': 0})
+        assert Holder(data={'a': a}).a is a
+        assert Holder(data={'a': a}, strict=False).a is a
+        assert Holder._restrictions['a'](a) is a
+        holder = Holder(data={'a': a})
+        holder.a = a
+        assert holder.a is a
@@ -0,0 +1,94 @@
+"""
+Test the bounded restriction cache behind SingletonRestriction.
+:date_created: 2026-10-17
+"""
+
+import gc
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.data_object.restriction import SingletonRestriction, restriction_cache
+from do_py.data_object.restriction_cache import RestrictionCache
+
+
+class Owner:
+    """
+    Stands in for a DataObject class owning restrictions.
+    """
+
+
+@pytest.fixture
+def cache():
+    return RestrictionCache(maxsize=2)
+
+
+class TestRestrictionCache:
+    def test_counters(self, cache):
+        assert cache.get('a') is None
+        r = R('cache-a')
+        assert cache.put('a', r) is r
+        assert cache.get('a') is r
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'evictions': 0, 'maxsize': 2}
+
+    def test_lru_eviction(self, cache):
+        a, b, c = R('cache-a'), R('cache-b'), R('cache-c')
+        cache.put('a', a)
+        cache.put('b', b)
+        cache.get('a')
+        cache.put('c', c)
+        assert 'b' not in cache
+        assert 'a' in cache and 'c' in cache
+        assert cache.evictions == 1
+
+    def test_owned_not_evicted(self, cache):
+        owner = Owner()
+        a = cache.put('a', R('cache-a'))
+        cache.add_owner(a, owner)
+        cache.put('b', R('cache-b'))
+        cache.put('c', R('cache-c'))
+        assert 'a' in cache and 'b' not in cache
+        del owner
+        gc.collect()
+        cache.put('d', R('cache-d'))
+        assert 'a' not in cache
+
+    def test_over_limit_when_all_owned(self, cache):
+        owner = Owner()
+        for k in 'abc':
+            cache.add_owner(cache.put(k, R('cache-%s' % k)), owner)
+        assert len(cache) == 3
+
+    def test_resize(self, cache):
+        cache.maxsize = None
+        for k in 'abcd':
+            cache.put(k, R('cache-%s' % k))
+        assert len(cache) == 4
+        cache.maxsize = 1
+        assert list(cache.stats().values())[2:] == [1, 3, 1]
+
+    def test_clear(self, cache):
+        cache.put('a', R('cache-a'))
+        cache.clear()
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'evictions': 0, 'maxsize': 2}
+
+
+class TestSingletonRestriction:
+    def test_shared_cache(self):
+        assert SingletonRestriction._cache is restriction_cache
+        misses = restriction_cache.misses
+        assert R('singleton-x', 'singleton-y') is R('singleton-x', 'singleton-y')
+        assert restriction_cache.misses == misses + 1
+
+    def test_class_restrictions_kept(self):
+        maxsize = restriction_cache.maxsize
+
+        class Owned(DataObject):
+            _restrictions = {'x': R('owned-x')}
+
+        try:
+            restriction_cache.maxsize = 0
+            assert R('owned-x') is Owned._restrictions['x']
+            assert R('unowned-x') is not R('unowned-x')
+        finally:
+            restriction_cache.maxsize = maxsize
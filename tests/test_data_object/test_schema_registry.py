@@ -0,0 +1,107 @@
+"""
+Test per-class memoization of schemas and ES mappings.
+:date_created: 2026-10-17
+"""
+
+import gc
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.data_object.restriction import ESR, ESEncoder
+from do_py.data_object.schema_registry import SchemaRegistry, build_schema, schema_registry
+from do_py.exceptions import DataObjectError
+
+
+class Parent(DataObject):
+    _restrictions = {'id': R.INT}
+
+
+class Child(Parent):
+    _restrictions = {'id': R.INT, 'name': R.STR}
+
+
+class Holder(DataObject):
+    _restrictions = {'child': Child, 'parent': R(Parent, type(None))}
+
+
+class TestSchemaRegistry:
+    def test_subclass_schema(self):
+        assert Parent.schema == {'id': 'int'}
+        assert Child.schema == {'id': 'int', 'name': 'str'}
+        assert Parent.schema == {'id': 'int'}
+
+    def test_schema_memoized(self):
+        assert Holder.schema is Holder.schema
+        assert Holder.schema['child'] is Child.schema
+
+    def test_empty_schema_memoized(self):
+        calls = []
+
+        class Empty(DataObject):
+            _restrictions = {}
+
+        registry = SchemaRegistry()
+        for _ in range(2):
+            assert registry.get(Empty, registry.SCHEMA, lambda cls: calls.append(cls) or {}) == {}
+        assert calls == [Empty]
+
+    def test_es_restrictions_memoized(self):
+        restriction = Holder._restrictions['parent']
+        mapping = R(Holder, type(None)).es_restrictions
+        assert mapping == {
+            'properties': {
+                'child': {'properties': {'id': ESR.INT, 'name': ESR.STR}},
+                'parent': {'properties': {'id': ESR.INT}},
+            }
+        }
+        assert R(Holder, type(None)).es_restrictions is mapping
+        assert restriction.es_restrictions is mapping['properties']['parent']
+
+    def test_declared_es_restrictions(self):
+        class Declared(DataObject):
+            _restrictions = {'x': R.INT}
+            es_restrictions = {'x': ESR.KEYWORD}
+
+        assert R(Declared, type(None)).es_restrictions == {'x': ESR.KEYWORD}
+        assert Declared not in schema_registry
+
+    def test_redeclared(self):
+        def declare(restrictions):
+            class Redeclared(DataObject):
+                _restrictions = restrictions
+
+            return Redeclared
+
+        assert declare({'x': R.INT}).schema == {'x': 'int'}
+        assert declare({'x': R.STR}).schema == {'x': 'str'}
+
+    def test_invalidate(self):
+        class Mutated(DataObject):
+            _restrictions = {'x': R.INT}
+
+        assert Mutated.schema == {'x': 'int'}
+        assert Mutated({'x': 1}).to_json() == '{"x": 1}'
+        Mutated._restrictions['y'] = R.STR
+        assert Mutated.schema == {'x': 'int'}
+        with pytest.raises(DataObjectError):
+            Mutated({'x': 1, 'y': 'a'})
+        schema_registry.invalidate(Mutated)
+        assert Mutated.schema == {'x': 'int', 'y': 'str'}
+        assert Mutated({'x': 1, 'y': 'a'}).to_json() == '{"x": 1, "y": "a"}'
+
+    def test_garbage_collected(self):
+        registry = SchemaRegistry()
+
+        class Temporary(DataObject):
+            _restrictions = {'x': R.INT}
+
+        registry.get(Temporary, registry.SCHEMA, build_schema)
+        assert len(registry) == 1 and Temporary in registry
+        del Temporary
+        gc.collect()
+        assert len(registry) == 0
+
+    def test_encoding_constant(self):
+        assert ESEncoder.encoding is ESEncoder.encoding
+        assert ESEncoder.default(int) == ESR.INT
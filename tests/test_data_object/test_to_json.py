@@ -0,0 +1,117 @@
+"""
+Test the per-class JSON serializer behind DataObject.to_json.
+:date_created: 2026-10-17
+"""
+
+import json
+from datetime import date, datetime
+from enum import IntEnum
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.common.managed_list import ManagedList
+from do_py.data_object.compact import CompactDataObject
+from do_py.utils.json_encoder import MyJSONEncoder
+
+
+class Level(IntEnum):
+    LOW = 1
+
+
+class Inner(DataObject):
+    _restrictions = {'val': R.INT, 'when': MgdDatetime.null_datetime()}
+
+
+class CompactInner(CompactDataObject):
+    _restrictions = {'val': R.INT}
+
+
+class Outer(DataObject):
+    _restrictions = {
+        'text': R.STR,
+        'number': R(int, float, type(None)),
+        'flag': R.BOOL,
+        'choice': R('a', 'é', 1),
+        'day': MgdDatetime.date(),
+        'inner': Inner,
+        'maybe': R(Inner, type(None)),
+        'inners': ManagedList(Inner, nullable=True),
+        'compact': CompactInner,
+        'anything': R(),
+    }
+
+
+def outer(**kwargs):
+    data = {
+        'text': 'snow ☃ "quoted"\n',
+        'number': 1.5,
+        'flag': True,
+        'choice': 'é',
+        'day': date(2026, 1, 2),
+        'inner': {'val': 1, 'when': datetime(2026, 1, 2, 3, 4, 5)},
+        'maybe': None,
+        'inners': [{'val': 2, 'when': None}],
+        'compact': {'val': 3},
+        'anything': {'list': [1, (2, 3)], 'nested': {'x': None}, 3: 'int key', 'level': Level.LOW},
+    }
+    data.update(kwargs)
+    return Outer(data)
+
+
+class TestToJson:
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {},
+            {'number': float('nan')},
+            {'number': float('-inf')},
+            {'number': 10**30},
+            {'number': None, 'inners': None},
+            {'maybe': {'val': -1, 'when': None}},
+            {'inners': []},
+            {'anything': datetime(2026, 1, 2)},
+            {'anything': Inner({'val': 5, 'when': None})},
+        ],
+    )
+    def test_byte_identical(self, kwargs):
+        obj = outer(**kwargs)
+        assert obj.to_json() == json.dumps(obj, cls=MyJSONEncoder)
+        assert repr(obj) == obj.to_json()
+
+    def test_non_strict(self):
+        obj = Outer(strict=False)
+        assert obj.to_json() == json.dumps(obj, cls=MyJSONEncoder)
+
+    def test_compact(self):
+        obj = CompactInner({'val': 1})
+        assert obj.to_json() == repr(obj) == '{"val": 1}'
+
+    def test_unserializable(self):
+        with pytest.raises(TypeError):
+            outer(anything=object()).to_json()
+
+    def test_key_count(self):
+        class Empty(DataObject):
+            _restrictions = {}
+
+        class Single(DataObject):
+            _restrictions = {'ключ': R.STR}
+
+        assert Empty().to_json() == '{}'
+        assert Single({'ключ': 'значение'}).to_json() == json.dumps({'ключ': 'значение'})
+
+    def test_compiled_on_first_use(self):
+        class Parent(DataObject):
+            _restrictions = {'x': R.INT}
+
+        class Child(Parent):
+            _restrictions = {'x': R.INT, 'y': R.INT}
+
+        assert '_serializer_' not in Parent.__dict__
+        assert Parent({'x': 1}).to_json() == '{"x": 1}'
+        assert '_serializer_' not in Child.__dict__
+        child = Child({'x': 1, 'y': 2})
+        assert outer(anything=child).to_json() == json.dumps(outer(anything=child), cls=MyJSONEncoder)
+        assert child.to_json() == '{"x": 1, "y": 2}'
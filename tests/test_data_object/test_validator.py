@@ -101,3 +101,69 @@ class TestValidatorNotInstantiable:
     def test_direct_instantiation_fails(self):
         with pytest.raises(NotImplementedError):
             Validator()
+
+
+class KeyedRangeValidator(Validator):
+    """low must be <= high. note is not checked by _validate."""
+
+    _restrictions = {'low': R.INT, 'high': R.INT, 'note': R.STR}
+    _validate_keys = ['low', 'high']
+    calls = []
+
+    def _validate(self):
+        self.calls.append(dict(self))
+        assert self.low <= self.high, 'low must be <= high'
+
+
+class TestValidatorKeys:
+    """Verify _validate_keys limits which assignments run _validate."""
+
+    def test_unrelated_key_skips_validate(self):
+        v = KeyedRangeValidator({'low': 1, 'high': 10, 'note': 'a'})
+        del KeyedRangeValidator.calls[:]
+        v.note = 'b'
+        assert v.note == 'b'
+        assert KeyedRangeValidator.calls == []
+
+    def test_dependent_key_runs_validate(self):
+        v = KeyedRangeValidator({'low': 1, 'high': 10, 'note': 'a'})
+        del KeyedRangeValidator.calls[:]
+        with pytest.raises(AssertionError):
+            v.low = 20
+        assert v == {'low': 1, 'high': 10, 'note': 'a'}
+        assert len(KeyedRangeValidator.calls) == 1
+
+    def test_compiled_as_frozenset(self):
+        assert KeyedRangeValidator._validate_keys == frozenset(['low', 'high'])
+
+    @pytest.mark.xfail(raises=AssertionError)
+    def test_unknown_key(self):
+        class Invalid(Validator):
+            _restrictions = {'low': R.INT}
+            _validate_keys = ['high']
+
+            def _validate(self):
+                pass
+
+
+class TestValidatorRollbackScope:
+    """Only the assigned key is restored after a failed validation."""
+
+    def test_nested_value_restored_by_reference(self):
+        class Inner(Validator):
+            _restrictions = {'x': R.INT}
+
+            def _validate(self):
+                pass
+
+        class Outer(Validator):
+            _restrictions = {'inner': Inner, 'limit': R.INT}
+
+            def _validate(self):
+                assert self.inner.x <= self.limit
+
+        o = Outer({'inner': {'x': 1}, 'limit': 5})
+        inner = o.inner
+        with pytest.raises(AssertionError):
+            o.inner = {'x': 10}
+        assert o.inner is inner
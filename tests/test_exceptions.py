@@ -0,0 +1,98 @@
+"""
+Test lazily formatted, structured DataObjectError and RestrictionError.
+:date_created: 2026-10-17
+"""
+
+import pickle
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.exceptions import DataObjectError, RestrictionError
+
+from .data import A
+
+
+class Counted:
+    """
+    Counts how often it is formatted into a message.
+    """
+
+    formatted = 0
+
+    def __str__(self):
+        Counted.formatted += 1
+        return 'counted'
+
+
+class Nested(DataObject):
+    _restrictions = {'a': A}
+
+
+class TestLazyMessage:
+    def test_messages(self):
+        assert str(RestrictionError.bad_data(1, [str])) == "'1' not allowed per restriction '[<class 'str'>]'"
+        assert str(DataObjectError.from_unknown_key('x', A)) == "A: Unexpected key 'x' in data."
+        assert str(DataObjectError.from_required_key('x', A)) == "A: Key 'x' required in data."
+        e = DataObjectError.from_restriction_error('id', A, RestrictionError.bad_data('x', [int]))
+        assert str(e) == "A.id: 'x' not allowed per restriction '[<class 'int'>]'"
+        assert repr(e) == 'DataObjectError(%r)' % str(e)
+
+    def test_formatted_on_str(self):
+        Counted.formatted = 0
+        e = DataObjectError.from_restriction_error('id', A, RestrictionError.bad_data(Counted(), [int]))
+        assert Counted.formatted == 0
+        assert str(e).startswith('A.id: ')
+        assert Counted.formatted == 1
+
+    def test_fields(self):
+        with pytest.raises(DataObjectError) as e:
+            A({'id': 'x', 'name': 'a', 'status': 0})
+        assert (e.value.key, e.value.cls_ref, e.value.data, e.value.allowed) == ('id', A, str, [int])
+        assert e.value.path == ('id',)
+        assert type(e.value.restriction_error) is RestrictionError
+
+    def test_nested_path(self):
+        inner = DataObjectError.from_restriction_error('status', A, RestrictionError.bad_data(9, [0, 1, 2]))
+        e = DataObjectError.from_restriction_error('a', Nested, inner)
+        assert e.path == ('a', 'status')
+        assert e.data == 9
+        assert str(e) == "Nested.a: A.status: '9' not allowed per restriction '[0, 1, 2]'"
+
+    def test_pickle(self):
+        e = DataObjectError.from_restriction_error('id', A, RestrictionError.bad_data('x', [int]))
+        restored = pickle.loads(pickle.dumps(e))
+        assert type(restored) is DataObjectError
+        assert str(restored) == str(e)
+        restored = pickle.loads(pickle.dumps(RestrictionError.bad_data(Counted(), [int])))
+        assert str(restored) == "'counted' not allowed per restriction '[<class 'int'>]'"
+
+    def test_pickle_fields(self):
+        inner = DataObjectError.from_restriction_error('status', A, RestrictionError.bad_data(9, [0, 1, 2]))
+        restored = pickle.loads(pickle.dumps(DataObjectError.from_restriction_error('a', Nested, inner)))
+        assert (restored.key, restored.cls_ref, restored.path) == ('a', Nested, ('a', 'status'))
+        assert (restored.data, restored.allowed) == (9, [0, 1, 2])
+        restored = pickle.loads(pickle.dumps(DataObjectError.from_required_key('id', A)))
+        assert (restored.key, restored.cls_ref, restored.path) == ('id', A, ('id',))
+
+    def test_pickle_unpicklable_fields(self):
+        class Local(DataObject):
+            _restrictions = {'x': R.INT}
+
+        e = DataObjectError.from_restriction_error('x', Local, RestrictionError.bad_data(lambda: None, [int]))
+        restored = pickle.loads(pickle.dumps(e))
+        assert str(restored) == str(e)
+        assert (restored.key, restored.cls_ref, restored.path) == ('x', None, ('x',))
+        assert (restored.data, restored.allowed) == (None, [int])
+
+    def test_args(self):
+        e = DataObjectError.from_required_key('id', A)
+        assert e.args == ("A: Key 'id' required in data.",)
+        e.args = ('replaced',)
+        assert str(e) == 'replaced' and e.args == ('replaced',)
+
+    def test_compile_time_errors(self):
+        with pytest.raises(RestrictionError, match='^Unhashable restriction'):
+            R({'a': 1}, {'b': 2})
+        assert RestrictionError('message').args == ('message',)
+        assert repr(RestrictionError('a', 'b')) == "RestrictionError('a', 'b')"
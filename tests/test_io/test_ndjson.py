@@ -0,0 +1,69 @@
+"""
+Test streaming NDJSON reading with do_py.io.iter_ndjson.
+:date_created: 2026-10-17
+"""
+
+import io
+import json
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.exceptions import DataObjectError
+from do_py.io import iter_ndjson
+
+
+class Row(DataObject):
+    _restrictions = {'id': R.INT, 'name': R.STR}
+
+
+rows = [{'id': i, 'name': 'row-%s' % i} for i in range(100)]
+lines = [json.dumps(row) for row in rows]
+bad_lines = [lines[0], '', '{"id": "x", "name": "a"}', '{"id": 1', '[1, 2]', '   ', lines[1]]
+
+
+def text(lines_):
+    return io.StringIO('\n'.join(lines_) + '\n')
+
+
+class TestIterNdjson:
+    @pytest.mark.parametrize('chunk_size', [1, 64, 1 << 20])
+    def test_valid(self, chunk_size):
+        objs = list(iter_ndjson(Row, text(lines), chunk_size=chunk_size))
+        assert objs == rows
+        assert all(type(obj) is Row for obj in objs)
+
+    def test_binary(self):
+        f = io.BytesIO(('\n'.join(lines)).encode('utf-8'))
+        assert list(Row.iter_ndjson(f)) == rows
+
+    def test_lazy(self):
+        f = text(lines)
+        it = Row.iter_ndjson(f, chunk_size=64)
+        assert next(it) == rows[0]
+        assert f.tell() < len(f.getvalue())
+
+    def test_raise(self):
+        it = Row.iter_ndjson(text(bad_lines))
+        assert next(it) == rows[0]
+        with pytest.raises(DataObjectError, match='^Line 3: Row.id'):
+            next(it)
+
+    @pytest.mark.parametrize('on_error, errors', [('ignore', None), ('collect', None)])
+    def test_arguments_checked(self, on_error, errors):
+        with pytest.raises(AssertionError):
+            Row.iter_ndjson(text(lines), on_error=on_error, errors=errors)
+
+    def test_skip(self):
+        assert list(Row.iter_ndjson(text(bad_lines), on_error='skip')) == rows[:2]
+
+    def test_collect(self):
+        errors = []
+        assert list(Row.iter_ndjson(text(bad_lines), on_error='collect', errors=errors)) == rows[:2]
+        assert [line_number for line_number, _ in errors] == [3, 4, 5]
+        assert all(type(e) is DataObjectError for _, e in errors)
+        assert 'Invalid JSON' in str(errors[1][1])
+        assert 'Expected an object, got list' in str(errors[2][1])
+
+    def test_non_strict(self):
+        assert list(Row.iter_ndjson(text(['{"id": 1}']), strict=False)) == [{'id': 1, 'name': None}]
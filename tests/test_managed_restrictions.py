@@ -4,6 +4,7 @@ Test managed restrictions.
 """
 
 import itertools as it
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -145,3 +146,29 @@ class TestManagedRestrictions:
             a.city = invalid_city
 
         assert a.city == city, 'Data was corrupted after failed validation'
+
+
+class TestManagedRestrictionsFrames:
+    """Managed data lives on a per-call frame, never on the shared restriction instance."""
+
+    def test_shared_instance_untouched(self):
+        name = Name()
+        assert name('john smith') == 'John Smith'
+        assert name.data is None
+
+    def test_failure_leaves_no_state(self):
+        age = Age()
+        with pytest.raises(AssertionError):
+            age(110.5)
+        assert age.data is None
+
+    def test_non_strict_skips_manage(self):
+        assert Name()('john smith', strict=False) == 'john smith'
+
+    def test_concurrent_calls(self):
+        """Many threads managing different values through one restriction instance see their own data."""
+        name = Name()
+        values = ['name %s' % i for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(name, values))
+        assert results == [v.title() for v in values]
@@ -0,0 +1,74 @@
+"""
+Test process-pool bulk validation with do_py.parallel.validate_many.
+:date_created: 2026-10-17
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from do_py import DataObject, R
+from do_py.common.managed_datetime import MgdDatetime
+from do_py.exceptions import DataObjectError
+from do_py.parallel import validate, validate_many
+
+from .data import A
+
+
+class Event(DataObject):
+    _restrictions = {'a': A, 'at': MgdDatetime.datetime()}
+
+
+records = [{'id': i, 'name': 'a-%s' % i, 'status': i % 3} for i in range(50)]
+invalid = [dict(records[0], status=5), {'id': 1}]
+
+
+class TestValidateMany:
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_order(self, workers):
+        data = validate_many(A, records, workers=workers, chunksize=7)
+        assert data == records
+        assert all(type(d) is dict for d in data)
+
+    def test_nested(self):
+        data = validate_many(Event, [{'a': records[0], 'at': '2026-01-02T03:04:05'}], workers=2)
+        assert data == [{'a': records[0], 'at': datetime(2026, 1, 2, 3, 4, 5)}]
+        assert type(data[0]['a']) is dict
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_collect(self, workers):
+        errors = []
+        data = validate_many(
+            A, records[:10] + invalid + records[10:], workers=workers, chunksize=4, on_error='collect', errors=errors
+        )
+        assert data == records
+        assert [i for i, _ in errors] == [10, 11]
+        assert all(type(e) is DataObjectError and e.key is not None and e.path for _, e in errors)
+
+    def test_skip(self):
+        assert validate_many(A, invalid + records, workers=2, chunksize=5, on_error='skip') == records
+
+    def test_raise(self):
+        with pytest.raises(DataObjectError, match="Key 'name' required"):
+            validate_many(A, records + invalid[1:], workers=2, chunksize=5)
+
+    def test_raise_cancels_pending(self, monkeypatch):
+        shutdowns = []
+
+        class Executor(ProcessPoolExecutor):
+            def shutdown(self, wait=True, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+                super(Executor, self).shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(validate, 'ProcessPoolExecutor', Executor)
+        with pytest.raises(DataObjectError):
+            validate_many(A, invalid + records, workers=2, chunksize=1)
+        assert shutdowns[0] == (False, True)
+
+    def test_local_class(self):
+        class Local(DataObject):
+            _restrictions = {'x': R.INT}
+
+        with pytest.raises(AssertionError):
+            validate_many(Local, [{'x': 1}], workers=2)
@@ -223,3 +223,24 @@ class TestRestriction:
 
         for k in Singletons._restrictions:
             assert id(Singletons._restrictions[k]) == id(SampleC._restrictions[k])
+
+    def test_allowed_set(self):
+        codes = R(*['C%03d' % i for i in range(500)])
+        assert codes._allowed_set == frozenset(codes.allowed)
+        assert codes('C499') == 'C499'
+        with pytest.raises(RestrictionError):
+            codes('C500')
+        assert R.INT._allowed_set == frozenset([int])
+
+    def test_unhashable_value_data(self):
+        class Unhashables(DataObject):
+            _restrictions = {'x': R(1, (1,), frozenset({1}))}
+
+        for data in [[1], {'a': 1}]:
+            with pytest.raises(RestrictionError):
+                Unhashables._restrictions['x'](data)
+            with pytest.raises(DataObjectError):
+                Unhashables({'x': data})
+        # NOTE: Unhashable data falls back to comparing against each allowed value, and {1} == frozenset({1}).
+        assert Unhashables._restrictions['x']({1}) == {1}
+        assert Unhashables({'x': {1}}).x == {1}